@@ -1,7 +1,12 @@
 # 필요한 라이브러리 임포트
 import pandas as pd
+import asyncio
+import csv
+import io
 import json
-from models import Teacher, Location
+import re
+from functools import cached_property
+from models import Teacher, LocationsSoA
 from typing import List
 import os
 import numpy as np
@@ -11,6 +16,92 @@ import logging
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# CSV별 컬럼 타입 (지정된 컬럼은 타입 추론을 건너뜀)
+_SCHOOL_DATA_DTYPES = {'선생님': str, '과목': str, '담당 교실': str, '담당 반': str}
+_LOCATION_DTYPES = {'building': str, 'floor': np.int32, 'room_number': str,
+                    'x_coord': np.float32, 'y_coord': np.float32}
+_DELIVERY_DTYPES = {'id': str, 'pickup_location': str, 'delivery_location': str,
+                    'weight': np.float32, 'volume': np.float32}
+_VEHICLE_DTYPES = {'id': str, 'current_location': str, 'capacity': np.float32,
+                   'fuel_level': np.float32}
+_DELIVERY_REQUIRED_COLUMNS = ['id', 'pickup_location', 'delivery_location', 'time_window']
+_DELIVERY_CHUNK_SIZE = 100_000  # 배달 데이터를 한 번에 읽을 행 수
+# 파일 이름(확장자 제외)별 read_csv 컬럼 타입 (다른 모듈에서도 사용)
+CSV_DTYPES = {'school_data': _SCHOOL_DATA_DTYPES, 'locations': _LOCATION_DTYPES}
+
+# 위치 정규화용 정규식 (영숫자/공백 외 문자, 연속 공백)
+_NON_ALNUM_RE = re.compile(r'[^\w\s]|_')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def parse_cell_value(value, dtype):
+    """편집기에서 입력한 값을 컬럼 타입에 맞게 변환
+    Args:
+        value: 입력 값 (보통 문자열)
+        dtype: 대상 컬럼의 dtype
+    Returns:
+        컬럼 타입에 맞게 변환된 값 (빈 문자열은 결측치)
+    Raises:
+        ValueError: 컬럼 타입으로 변환할 수 없는 경우
+    """
+    if not isinstance(value, str) or not pd.api.types.is_numeric_dtype(dtype):
+        return value
+    if pd.api.types.is_bool_dtype(dtype):
+        text = value.strip().lower()
+        if text not in ('true', 'false'):
+            raise ValueError(f"'{value}'은(는) true/false 값이 아닙니다.")
+        return text == 'true'
+    text = value.strip()
+    if text == '':
+        if pd.api.types.is_integer_dtype(dtype):
+            raise ValueError("정수 컬럼은 비워 둘 수 없습니다.")
+        return np.nan
+    number = pd.to_numeric(text)
+    if pd.api.types.is_integer_dtype(dtype):
+        # 소수점 이하를 말없이 버리지 않도록 정수 값인지 확인
+        if number != int(number):
+            raise ValueError(f"'{value}'은(는) 정수가 아닙니다.")
+        number = int(number)
+    return np.dtype(dtype).type(number)
+
+class RowView:
+    """
+    DataFrame 컬럼 배열 위에서 행 dict를 필요할 때만 만들어 주는 뷰
+    
+    view[i]는 i번째 행 dict, view['컬럼']은 컬럼 배열을 반환하고,
+    순회하면 행 dict를 차례로 돌려줍니다. 'in'은 컬럼 존재 여부를 확인합니다.
+    """
+    def __init__(self, df):
+        """
+        Args:
+            df (pandas.DataFrame): 원본 데이터
+        """
+        self._cols = {col: df[col].to_numpy() for col in df.columns}
+        self._len = len(df)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._cols[key]
+        return {col: values[key] for col, values in self._cols.items()}
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self[i]
+
+    def __contains__(self, col):
+        return col in self._cols
+
+    @property
+    def columns(self):
+        """컬럼명 목록"""
+        return list(self._cols)
+
+    def items(self):
+        """(컬럼명, 컬럼 배열) 쌍"""
+        return self._cols.items()
+
 class DataLoader:
     """학교 데이터를 로드하고 관리하는 클래스"""
     def __init__(self, data_dir='data'):
@@ -19,41 +110,187 @@ class DataLoader:
             data_dir (str): 데이터 파일이 저장된 디렉토리 경로
         """
         self.data_dir = data_dir
-        self.school_data = self.load_school_data()
-        self.locations = self.load_locations()
+        self._csv_cache = {}  # 경로별 (파일 상태, DataFrame)
+        self._json_cache = {}  # 경로별 (파일 상태, dict)
+        self._teachers_cache = None  # (school_data 해시, 교사 목록)
         self.cache = {}  # 데이터 캐시
-        self.last_modified = {}  # 파일별 마지막 수정 시간
+        self.last_modified = {}  # 파일별 마지막 수정 시간 (ns)
         
         # 데이터 디렉토리가 없으면 생성
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
             logger.info(f"데이터 디렉토리 생성됨: {data_dir}")
 
+    @cached_property
+    def school_data(self):
+        """학교 데이터 행 뷰 (처음 접근할 때 로드)"""
+        return RowView(self._school_df)
+
+    @cached_property
+    def locations(self):
+        """위치 정보 (처음 접근할 때 로드)"""
+        return self.load_locations()
+
+    @cached_property
+    def _school_df(self):
+        """school_data와 load_teachers가 함께 쓰는 DataFrame (처음 접근할 때 로드)"""
+        return self._read_school_df()
+
+    def _read_school_df(self):
+        """school_data.csv를 DataFrame으로 읽기"""
+        return pd.read_csv(f'{self.data_dir}/school_data.csv', dtype=_SCHOOL_DATA_DTYPES)
+
     def load_school_data(self):
-        """학교 데이터를 CSV 파일에서 로드"""
-        df = pd.read_csv(f'{self.data_dir}/school_data.csv')
-        return df.to_dict('records')
+        """학교 데이터를 CSV 파일에서 로드
+        Returns:
+            RowView: 행은 요청할 때만 dict로 만드는 학교 데이터 뷰
+        """
+        # 다시 읽은 DataFrame으로 load_teachers가 쓰는 DataFrame도 갱신
+        self._school_df = self._read_school_df()
+        # 행마다 dict를 미리 만들지 않고 컬럼 배열 위의 뷰로 반환
+        return RowView(self._school_df)
 
     def load_teachers(self) -> List[Teacher]:
         """교사 정보를 로드하여 Teacher 객체 리스트로 반환"""
-        df = pd.read_csv(f'{self.data_dir}/school_data.csv')
-        # 교사명, 담당 교실만 추출 (중복 제거)
-        teachers = df[['선생님', '담당 교실']].drop_duplicates()
-        return [Teacher(row['선생님'], row['담당 교실']) for _, row in teachers.iterrows()]
+        # 교사명, 담당 교실만 추출
+        pairs = self._school_df[['선생님', '담당 교실']]
+        # 두 컬럼 내용이 이전 호출과 같으면 중복 제거 결과를 재사용
+        key = (len(pairs), int(pd.util.hash_pandas_object(pairs, index=False).sum()))
+        if self._teachers_cache is not None and self._teachers_cache[0] == key:
+            return list(self._teachers_cache[1])
+        teachers = pairs.drop_duplicates()
+        # 행 단위(iterrows) 대신 컬럼 배열을 직접 꺼내 zip
+        names = teachers['선생님'].to_numpy()
+        rooms = teachers['담당 교실'].to_numpy()
+        result = [Teacher(name, room) for name, room in zip(names, rooms)]
+        self._teachers_cache = (key, result)
+        return list(result)
+
+    def load_locations(self) -> LocationsSoA:
+        """위치 정보를 로드하여 컬럼별 배열(LocationsSoA)로 반환"""
+        df = pd.read_csv(f'{self.data_dir}/locations.csv', dtype=_LOCATION_DTYPES)
+        # 읽을 때 타입이 정해지므로 컬럼 배열을 그대로 사용
+        return LocationsSoA(xs=df['x_coord'].to_numpy(np.float32),
+                            ys=df['y_coord'].to_numpy(np.float32),
+                            floors=df['floor'].to_numpy(np.int32),
+                            buildings=df['building'].to_numpy(),
+                            rooms=df['room_number'].to_numpy())
 
-    def load_locations(self) -> List[Location]:
-        """위치 정보를 로드하여 Location 객체 리스트로 반환"""
-        df = pd.read_csv(f'{self.data_dir}/locations.csv')
-        return [Location(row['building'], int(row['floor']), row['room_number'], float(row['x_coord']), float(row['y_coord'])) for _, row in df.iterrows()]
+    def _file_stamp(self, path):
+        """캐시 키로 쓸 파일 상태 (수정 시간 ns, 크기) 반환"""
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
 
     def load_csv(self, name):
-        """CSV 파일을 DataFrame으로 로드"""
-        return pd.read_csv(f'{self.data_dir}/{name}.csv')
+        """CSV 파일을 DataFrame으로 로드 (파일이 바뀌지 않았으면 캐시 사용)"""
+        path = f'{self.data_dir}/{name}.csv'
+        stamp = self._file_stamp(path)
+        cached = self._csv_cache.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        df = self._read_csv_sidecar(path, stamp, dtype=CSV_DTYPES.get(name))
+        self._csv_cache[path] = (stamp, df)
+        return df
+
+    def _read_csv_sidecar(self, path, stamp, dtype=None):
+        """CSV 옆에 저장한 피클 파일이 같은 CSV 상태로 만들어졌으면 그것을 읽고,
+        아니면 CSV를 파싱한 뒤 피클로 저장
+        Args:
+            path (str): CSV 파일 경로
+            stamp (tuple): CSV 파일 상태 (수정 시간 ns, 크기)
+            dtype (dict): read_csv에 넘길 컬럼 타입
+        Returns:
+            pandas.DataFrame: 로드된 데이터
+        """
+        sidecar = os.path.splitext(path)[0] + '.pkl'
+        try:
+            # 피클에 기록된 CSV 상태와 정확히 같을 때만 사용 (예전 CSV로 되돌린 경우도 다시 읽음)
+            cached = pd.read_pickle(sidecar)
+            if isinstance(cached, dict) and cached.get('source') == stamp:
+                return cached['data']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"캐시 파일 로드 실패, CSV를 다시 읽습니다: {str(e)}")
+        df = pd.read_csv(path, dtype=dtype)
+        self._write_csv_sidecar(path, df, stamp)
+        return df
+
+    def _write_csv_sidecar(self, path, df, stamp):
+        """CSV와 같은 내용을 타입이 유지되는 피클 파일로 저장 (CSV 상태를 함께 기록)"""
+        try:
+            pd.to_pickle({'source': stamp, 'data': df}, os.path.splitext(path)[0] + '.pkl')
+        except Exception as e:
+            logger.warning(f"캐시 파일 저장 실패: {str(e)}")
+
+    def append_csv(self, name, row):
+        """CSV 파일 끝에 한 행만 추가 (전체 파일을 다시 쓰지 않음)
+        Args:
+            name (str): 확장자를 뺀 CSV 파일 이름
+            row (dict): 컬럼명을 키로 하는 새 행
+        Raises:
+            ValueError: 새 행이 CSV_DTYPES에 지정한 타입으로 읽히지 않을 때 (파일은 그대로 둠)
+        """
+        path = f'{self.data_dir}/{name}.csv'
+        cached = self._csv_cache.get(path)
+        if cached:
+            columns = cached[1].columns
+        elif os.path.exists(path) and os.path.getsize(path) > 0:
+            columns = pd.read_csv(path, nrows=0).columns
+        else:
+            columns = list(row)
+        # 파일의 컬럼 순서에 맞춰 정렬 (없는 컬럼은 빈 값)
+        cells = ['' if row.get(col) is None else row.get(col) for col in columns]
+        # 파일에 쓰기 전에 새 행을 load_csv와 같은 방식으로 파싱해 지정한 타입에 맞는지 확인
+        # (맞지 않는 행이 파일에 남으면 이후 load_csv가 계속 실패함)
+        dtype = CSV_DTYPES.get(name)
+        row_buf = io.StringIO()
+        csv.writer(row_buf, lineterminator='\n').writerows([columns, cells])
+        row_buf.seek(0)
+        try:
+            new_row = pd.read_csv(row_buf, dtype=dtype)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"'{name}'에 추가할 행의 값이 컬럼 타입과 맞지 않습니다: {str(e)}") from e
+        # DataFrame을 만들지 않고 csv.writer로 한 줄만 만듦
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\n')
+        # 파일은 한 번만 열어 끝 바이트 확인, 기록, 상태 확인을 모두 처리
+        with open(path, 'a+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                writer.writerow(columns)
+            else:
+                # 마지막 줄에 개행이 없으면 새 행이 붙어버리므로 먼저 개행 추가
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    buf.write('\n')
+            writer.writerow(cells)
+            f.write(buf.getvalue().encode('utf-8'))
+            f.flush()
+            st = os.fstat(f.fileno())
+        # 캐시된 DataFrame에도 같은 행을 붙이고 파일 상태만 갱신
+        if cached:
+            # df.loc[len(df)]로 늘리면 컬럼 타입이 바뀌므로(int32 -> int64, 빈 값 -> object)
+            # 미리 파싱해 둔 한 행짜리 DataFrame을 이어 붙이고 지정한 타입으로 맞춤
+            df = pd.concat([cached[1], new_row], ignore_index=True)
+            if dtype:
+                df = df.astype({col: t for col, t in dtype.items() if col in df.columns})
+            stamp = (st.st_mtime_ns, st.st_size)
+            self._csv_cache[path] = (stamp, df)
+            # 다음 실행에서 CSV를 다시 파싱하지 않도록 피클 파일도 갱신 (load_csv와 같은 타입으로 저장)
+            self._write_csv_sidecar(path, df, stamp)
 
     def load_json(self, name):
-        """JSON 파일을 dict로 로드"""
-        with open(f'{self.data_dir}/{name}.json', encoding='utf-8') as f:
-            return json.load(f)
+        """JSON 파일을 dict로 로드 (파일이 바뀌지 않았으면 캐시 사용)"""
+        path = f'{self.data_dir}/{name}.json'
+        stamp = self._file_stamp(path)
+        cached = self._json_cache.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        self._json_cache[path] = (stamp, data)
+        return data
 
     def load_delivery_data(self, file_name='delivery_data.csv'):
         """
@@ -68,33 +305,46 @@ class DataLoader:
         try:
             file_path = os.path.join(self.data_dir, file_name)
             
-            # 파일이 존재하는지 확인
-            if not os.path.exists(file_path):
+            # 존재 여부와 수정 시간을 stat 한 번으로 확인
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 logger.error(f"배달 데이터 파일을 찾을 수 없음: {file_path}")
                 return None
-                
-            # 파일 수정 시간 확인
-            current_mtime = os.path.getmtime(file_path)
-            if file_path in self.last_modified and current_mtime == self.last_modified[file_path]:
+            current_mtime = st.st_mtime_ns
+            if self.last_modified.get(file_path) == current_mtime:
                 logger.info("캐시된 배달 데이터 사용")
                 return self.cache.get(file_path)
             
-            # CSV 파일 로드
-            df = pd.read_csv(file_path)
-            
-            # 필수 컬럼 확인
-            required_columns = ['id', 'pickup_location', 'delivery_location', 'time_window']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                logger.error(f"필수 컬럼 누락: {missing_columns}")
+            # 전처리 결과 파일에 기록된 CSV 상태(수정 시간 ns, 크기)가 같으면 전처리 없이 그대로 사용
+            norm_path = os.path.splitext(file_path)[0] + '.norm.pkl'
+            source_stamp = (current_mtime, st.st_size)
+            try:
+                cached = pd.read_pickle(norm_path)
+                if isinstance(cached, dict) and cached.get('source') == source_stamp:
+                    df = cached['data']
+                    self.cache[file_path] = df
+                    self.last_modified[file_path] = current_mtime
+                    logger.info(f"전처리된 배달 데이터 로드 완료: {len(df)}개 레코드")
+                    return df
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"전처리 캐시 파일 로드 실패, CSV를 다시 읽습니다: {str(e)}")
+            
+            # 청크 단위로 읽고 전처리한 뒤 합침 (필수 컬럼이 없으면 청크가 없음)
+            chunks = list(self.load_delivery_data_iter(file_name))
+            if not chunks:
                 return None
+            df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
             
-            # 데이터 전처리
-            df = self._preprocess_delivery_data(df)
-            
-            # 캐시 업데이트
+            # 캐시 업데이트 (다음 실행을 위해 전처리 결과도 파일로 저장)
             self.cache[file_path] = df
             self.last_modified[file_path] = current_mtime
+            try:
+                pd.to_pickle({'source': source_stamp, 'data': df}, norm_path)
+            except Exception as e:
+                logger.warning(f"전처리 캐시 파일 저장 실패: {str(e)}")
             
             logger.info(f"배달 데이터 로드 완료: {len(df)}개 레코드")
             return df
@@ -103,6 +353,31 @@ class DataLoader:
             logger.error(f"배달 데이터 로드 중 오류 발생: {str(e)}")
             return None
 
+    def load_delivery_data_iter(self, file_name='delivery_data.csv', chunksize=_DELIVERY_CHUNK_SIZE):
+        """
+        배달 데이터를 청크 단위로 읽어 전처리된 DataFrame을 차례로 반환
+        (파일 전체를 메모리에 올리지 않음, 캐시는 사용하지 않음)
+        
+        Args:
+            file_name (str): 배달 데이터 파일명
+            chunksize (int): 한 번에 읽을 행 수
+            
+        Yields:
+            pandas.DataFrame: 전처리된 배달 데이터 청크
+        """
+        file_path = os.path.join(self.data_dir, file_name)
+        # 필수 컬럼 확인 (time_window가 없으면 parse_dates에서 실패하므로 헤더만 먼저 읽음)
+        columns = pd.read_csv(file_path, nrows=0).columns
+        missing_columns = [col for col in _DELIVERY_REQUIRED_COLUMNS if col not in columns]
+        if missing_columns:
+            logger.error(f"필수 컬럼 누락: {missing_columns}")
+            return
+        # CSV 파일 로드 (시간대 컬럼은 읽으면서 바로 datetime으로 변환)
+        with pd.read_csv(file_path, dtype=_DELIVERY_DTYPES, parse_dates=['time_window'],
+                         chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield self._preprocess_delivery_data(chunk)
+
     def load_vehicle_data(self, file_name='vehicle_data.csv'):
         """
         차량 데이터를 로드하고 전처리
@@ -116,19 +391,18 @@ class DataLoader:
         try:
             file_path = os.path.join(self.data_dir, file_name)
             
-            # 파일이 존재하는지 확인
-            if not os.path.exists(file_path):
+            # 존재 여부와 수정 시간을 stat 한 번으로 확인
+            try:
+                current_mtime = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
                 logger.error(f"차량 데이터 파일을 찾을 수 없음: {file_path}")
                 return None
-                
-            # 파일 수정 시간 확인
-            current_mtime = os.path.getmtime(file_path)
-            if file_path in self.last_modified and current_mtime == self.last_modified[file_path]:
+            if self.last_modified.get(file_path) == current_mtime:
                 logger.info("캐시된 차량 데이터 사용")
                 return self.cache.get(file_path)
             
             # CSV 파일 로드
-            df = pd.read_csv(file_path)
+            df = pd.read_csv(file_path, dtype=_VEHICLE_DTYPES)
             
             # 필수 컬럼 확인
             required_columns = ['id', 'capacity', 'current_location']
@@ -151,6 +425,43 @@ class DataLoader:
             logger.error(f"차량 데이터 로드 중 오류 발생: {str(e)}")
             return None
 
+    async def load_delivery_data_async(self, file_name='delivery_data.csv'):
+        """
+        load_delivery_data의 비동기 버전 (작업 스레드에서 실행)
+        
+        Args:
+            file_name (str): 배달 데이터 파일명
+            
+        Returns:
+            pandas.DataFrame: 전처리된 배달 데이터
+        """
+        return await asyncio.to_thread(self.load_delivery_data, file_name)
+
+    async def load_vehicle_data_async(self, file_name='vehicle_data.csv'):
+        """
+        load_vehicle_data의 비동기 버전 (작업 스레드에서 실행)
+        
+        Args:
+            file_name (str): 차량 데이터 파일명
+            
+        Returns:
+            pandas.DataFrame: 전처리된 차량 데이터
+        """
+        return await asyncio.to_thread(self.load_vehicle_data, file_name)
+
+    async def load_all(self):
+        """
+        배달 데이터와 차량 데이터를 동시에 로드
+        
+        Returns:
+            tuple: (배달 데이터, 차량 데이터)
+        """
+        delivery_data, vehicle_data = await asyncio.gather(
+            self.load_delivery_data_async(),
+            self.load_vehicle_data_async()
+        )
+        return delivery_data, vehicle_data
+
     def _preprocess_delivery_data(self, df):
         """
         배달 데이터 전처리
@@ -162,30 +473,19 @@ class DataLoader:
             pandas.DataFrame: 전처리된 배달 데이터
         """
         try:
-            # 결측치 처리
-            df = df.fillna({
-                'priority': 0,  # 우선순위가 없는 경우 기본값 0
-                'weight': 0,    # 무게가 없는 경우 기본값 0
-                'volume': 0     # 부피가 없는 경우 기본값 0
-            })
-            
-            # 시간대 데이터 변환
-            if 'time_window' in df.columns:
-                df['time_window'] = pd.to_datetime(df['time_window'])
-            
-            # 위치 데이터 정규화
-            if 'pickup_location' in df.columns:
-                df['pickup_location'] = df['pickup_location'].apply(self._normalize_location)
-            if 'delivery_location' in df.columns:
-                df['delivery_location'] = df['delivery_location'].apply(self._normalize_location)
-            
-            # 데이터 타입 변환
-            df['id'] = df['id'].astype(str)
-            df['priority'] = df['priority'].astype(int)
-            df['weight'] = df['weight'].astype(float)
-            df['volume'] = df['volume'].astype(float)
-            
-            return df
+            # 결측치 처리, 위치 정규화, 타입 변환을 컬럼마다 한 번에 계산
+            # (필수 컬럼은 load_delivery_data에서 이미 확인됨)
+            processed = {
+                'id': df['id'].astype(str, copy=False),
+                'pickup_location': self._normalize_locations(df['pickup_location']),
+                'delivery_location': self._normalize_locations(df['delivery_location']),
+                'priority': df['priority'].fillna(0).astype(np.int16, copy=False),  # 기본 우선순위 0
+                'weight': df['weight'].fillna(0).astype(np.float32, copy=False),    # 기본 무게 0
+                'volume': df['volume'].fillna(0).astype(np.float32, copy=False)     # 기본 부피 0
+            }
+            
+            # 나머지 컬럼은 원래 순서대로 그대로 사용
+            return pd.DataFrame({col: processed.get(col, df[col]) for col in df.columns}, index=df.index)
             
         except Exception as e:
             logger.error(f"배달 데이터 전처리 중 오류 발생: {str(e)}")
@@ -211,12 +511,12 @@ class DataLoader:
             
             # 위치 데이터 정규화
             if 'current_location' in df.columns:
-                df['current_location'] = df['current_location'].apply(self._normalize_location)
+                df['current_location'] = self._normalize_locations(df['current_location'])
             
             # 데이터 타입 변환
             df['id'] = df['id'].astype(str)
-            df['capacity'] = df['capacity'].astype(float)
-            df['fuel_level'] = df['fuel_level'].astype(float)
+            df['capacity'] = df['capacity'].astype(np.float32)
+            df['fuel_level'] = df['fuel_level'].astype(np.float32)
             
             return df
             
@@ -224,34 +524,29 @@ class DataLoader:
             logger.error(f"차량 데이터 전처리 중 오류 발생: {str(e)}")
             return df
 
-    def _normalize_location(self, location):
+    def _normalize_locations(self, locations):
         """
-        위치 데이터 정규화
+        위치 데이터 정규화 (컬럼 단위)
         
         Args:
-            location (str): 원본 위치 데이터
+            locations (pandas.Series): 원본 위치 데이터
             
         Returns:
-            str: 정규화된 위치 데이터
+            pandas.Series: 정규화된 위치 데이터 (결측치는 "unknown")
         """
-        try:
-            if pd.isna(location):
-                return "unknown"
-                
-            # 문자열로 변환
-            location = str(location).strip().lower()
-            
-            # 특수문자 제거
-            location = ''.join(c for c in location if c.isalnum() or c.isspace())
-            
-            # 공백 정규화
-            location = ' '.join(location.split())
-            
-            return location
-            
-        except Exception as e:
-            logger.error(f"위치 데이터 정규화 중 오류 발생: {str(e)}")
-            return "unknown"
+        # 위치 값은 많이 반복되므로 고유값만 정규화한 뒤 코드로 펼침 (결측치는 코드 -1)
+        codes, uniques = pd.factorize(locations)
+        
+        # 소문자 변환 후 특수문자 제거, 공백 정규화
+        normalized = (pd.Series(uniques, dtype=object).astype(str)
+                      .str.lower()
+                      .str.replace(_NON_ALNUM_RE, '', regex=True)
+                      .str.replace(_WHITESPACE_RE, ' ', regex=True)
+                      .str.strip()
+                      .to_numpy(dtype=object))
+        
+        values = np.append(normalized, 'unknown')[codes]
+        return pd.Series(values, index=locations.index, name=locations.name)
 
     def save_data(self, data, file_name):
         """
@@ -280,7 +575,7 @@ class DataLoader:
             
             # 캐시 및 수정 시간 업데이트
             self.cache[file_path] = data
-            self.last_modified[file_path] = os.path.getmtime(file_path)
+            self.last_modified[file_path] = os.stat(file_path).st_mtime_ns
             
             logger.info(f"데이터 저장 완료: {file_path}")
             return True
@@ -293,4 +588,7 @@ class DataLoader:
         """데이터 캐시 초기화"""
         self.cache.clear()
         self.last_modified.clear()
+        self._csv_cache.clear()
+        self._json_cache.clear()
+        self._teachers_cache = None
         logger.info("데이터 캐시가 초기화되었습니다.") 
\ No newline at end of file
@@ -1,219 +1,35 @@
 # 필요한 라이브러리 임포트
 import customtkinter as ctk
-import pandas as pd
 from tkinter import messagebox
-import sys
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                           QHBoxLayout, QPushButton, QLabel, QFileDialog,
-                           QTableWidget, QTableWidgetItem, QMessageBox)
-from PyQt5.QtCore import Qt
+import threading
+import queue
 import logging
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-class DataManagerGUI(QMainWindow):
-    """
-    데이터 관리 GUI 클래스
-    
-    이 클래스는 데이터 관리 기능을 위한 그래픽 사용자 인터페이스를 제공합니다.
-    데이터 로드, 저장, 편집 등의 기능을 포함합니다.
-    """
-    
-    def __init__(self):
-        """DataManagerGUI 초기화"""
-        super().__init__()
-        self.init_ui()
-        self.data = None
-        self.current_file = None
-        
-    def init_ui(self):
-        """사용자 인터페이스 초기화"""
-        # 메인 윈도우 설정
-        self.setWindowTitle('데이터 관리 시스템')
-        self.setGeometry(100, 100, 800, 600)
-        
-        # 중앙 위젯 생성
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # 메인 레이아웃 설정
-        layout = QVBoxLayout(central_widget)
-        
-        # 버튼 레이아웃 생성
-        button_layout = QHBoxLayout()
-        
-        # 데이터 로드 버튼
-        self.load_button = QPushButton('데이터 로드')
-        self.load_button.clicked.connect(self.load_data)
-        button_layout.addWidget(self.load_button)
-        
-        # 데이터 저장 버튼
-        self.save_button = QPushButton('데이터 저장')
-        self.save_button.clicked.connect(self.save_data)
-        button_layout.addWidget(self.save_button)
-        
-        # 데이터 편집 버튼
-        self.edit_button = QPushButton('데이터 편집')
-        self.edit_button.clicked.connect(self.edit_data)
-        button_layout.addWidget(self.edit_button)
-        
-        # 버튼 레이아웃을 메인 레이아웃에 추가
-        layout.addLayout(button_layout)
-        
-        # 데이터 테이블 생성
-        self.table = QTableWidget()
-        layout.addWidget(self.table)
-        
-        # 상태 표시줄 생성
-        self.statusBar().showMessage('준비')
-        
-    def load_data(self):
-        """데이터 파일 로드"""
-        try:
-            # 파일 선택 대화상자 표시
-            file_name, _ = QFileDialog.getOpenFileName(
-                self,
-                "데이터 파일 선택",
-                "",
-                "CSV 파일 (*.csv);;Excel 파일 (*.xlsx *.xls);;모든 파일 (*.*)"
-            )
-            
-            if file_name:
-                # 파일 확장자에 따라 데이터 로드
-                if file_name.endswith('.csv'):
-                    self.data = pd.read_csv(file_name)
-                elif file_name.endswith(('.xlsx', '.xls')):
-                    self.data = pd.read_excel(file_name)
-                else:
-                    QMessageBox.warning(self, '경고', '지원하지 않는 파일 형식입니다.')
-                    return
-                    
-                # 테이블 업데이트
-                self.update_table()
-                self.current_file = file_name
-                self.statusBar().showMessage(f'파일 로드됨: {file_name}')
-                logger.info(f"데이터 파일 로드 완료: {file_name}")
-                
-        except Exception as e:
-            QMessageBox.critical(self, '오류', f'데이터 로드 중 오류 발생: {str(e)}')
-            logger.error(f"데이터 로드 중 오류 발생: {str(e)}")
-            
-    def save_data(self):
-        """데이터 파일 저장"""
-        try:
-            if self.data is None:
-                QMessageBox.warning(self, '경고', '저장할 데이터가 없습니다.')
-                return
-                
-            # 파일 저장 대화상자 표시
-            file_name, _ = QFileDialog.getSaveFileName(
-                self,
-                "데이터 저장",
-                "",
-                "CSV 파일 (*.csv);;Excel 파일 (*.xlsx);;모든 파일 (*.*)"
-            )
-            
-            if file_name:
-                # 파일 확장자에 따라 데이터 저장
-                if file_name.endswith('.csv'):
-                    self.data.to_csv(file_name, index=False)
-                elif file_name.endswith('.xlsx'):
-                    self.data.to_excel(file_name, index=False)
-                else:
-                    QMessageBox.warning(self, '경고', '지원하지 않는 파일 형식입니다.')
-                    return
-                    
-                self.current_file = file_name
-                self.statusBar().showMessage(f'파일 저장됨: {file_name}')
-                logger.info(f"데이터 파일 저장 완료: {file_name}")
-                
-        except Exception as e:
-            QMessageBox.critical(self, '오류', f'데이터 저장 중 오류 발생: {str(e)}')
-            logger.error(f"데이터 저장 중 오류 발생: {str(e)}")
-            
-    def edit_data(self):
-        """데이터 편집"""
-        try:
-            if self.data is None:
-                QMessageBox.warning(self, '경고', '편집할 데이터가 없습니다.')
-                return
-                
-            # 편집 모드 활성화
-            self.table.setEditTriggers(QTableWidget.DoubleClicked)
-            self.statusBar().showMessage('편집 모드 활성화')
-            logger.info("데이터 편집 모드 활성화")
-            
-        except Exception as e:
-            QMessageBox.critical(self, '오류', f'데이터 편집 중 오류 발생: {str(e)}')
-            logger.error(f"데이터 편집 중 오류 발생: {str(e)}")
-            
-    def update_table(self):
-        """테이블 위젯 업데이트"""
-        try:
-            if self.data is None:
-                return
-                
-            # 테이블 크기 설정
-            self.table.setRowCount(len(self.data))
-            self.table.setColumnCount(len(self.data.columns))
-            
-            # 컬럼 헤더 설정
-            self.table.setHorizontalHeaderLabels(self.data.columns)
-            
-            # 데이터 채우기
-            for i in range(len(self.data)):
-                for j in range(len(self.data.columns)):
-                    value = str(self.data.iloc[i, j])
-                    item = QTableWidgetItem(value)
-                    self.table.setItem(i, j, item)
-                    
-            # 컬럼 크기 자동 조정
-            self.table.resizeColumnsToContents()
-            logger.info("테이블 업데이트 완료")
-            
-        except Exception as e:
-            QMessageBox.critical(self, '오류', f'테이블 업데이트 중 오류 발생: {str(e)}')
-            logger.error(f"테이블 업데이트 중 오류 발생: {str(e)}")
-            
-    def closeEvent(self, event):
-        """
-        프로그램 종료 시 처리
-        
-        Args:
-            event: 종료 이벤트
-        """
-        reply = QMessageBox.question(
-            self,
-            '종료 확인',
-            '프로그램을 종료하시겠습니까?',
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            event.accept()
-            logger.info("프로그램 종료")
-        else:
-            event.ignore()
-            
-def main():
-    """메인 함수"""
-    app = QApplication(sys.argv)
-    window = DataManagerGUI()
-    window.show()
-    sys.exit(app.exec_())
+# 목록 텍스트박스에 표시할 최대 행 수 (높이 200px 기준으로 충분한 양)
+_MAX_LIST_ROWS = 200
+# 작업 스레드 결과를 메인 루프에서 확인하는 간격 (ms)
+_RESULT_POLL_MS = 50
 
 class DataManagerGUI:
     """데이터 관리 GUI 클래스"""
-    def __init__(self, parent, loader):
+    def __init__(self, parent, loader, route_opt):
         """데이터 관리 GUI 초기화
         Args:
             parent: 부모 윈도우
             loader: 데이터 로더 객체
+            route_opt (RouteOptimizer): 새 위치를 반영할 경로 최적화기
         """
         self.parent = parent
         self.loader = loader
+        self.route_opt = route_opt
+        self._write_lock = threading.Lock()  # 작업 스레드 간 CSV 쓰기 직렬화
+        # 작업 스레드가 끝나면 메인 루프에서 실행할 콜백을 넣는 큐 (Tk는 메인 스레드에서만 호출)
+        self._results = queue.Queue()
+        self._pending = 0  # 결과를 아직 처리하지 않은 작업 수 (메인 스레드에서만 변경)
+        self._shown = {}  # 텍스트박스별 (표시 중인 DataFrame, 행 수)
         
         # 탭뷰 생성
         self.tabview = ctk.CTkTabview(parent)
@@ -227,6 +43,15 @@ class DataManagerGUI:
         self.create_locations_tab()
         self.create_subjects_tab()
         self.create_school_data_tab()
+        
+        # 창을 먼저 그린 뒤 유휴 시간에 목록을 한 번에 채움
+        parent.after_idle(self._populate_all_lists)
+
+    def _populate_all_lists(self):
+        """세 목록을 모두 채움 (school_data는 로더 캐시로 한 번만 파싱)"""
+        self.update_location_list()
+        self.update_subject_list()
+        self.update_school_data_list()
 
     def create_locations_tab(self):
         """위치 관리 탭 생성"""
@@ -271,7 +96,6 @@ class DataManagerGUI:
         
         self.loc_list = ctk.CTkTextbox(list_frame, width=400, height=200)
         self.loc_list.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        self.update_location_list()
 
     def create_subjects_tab(self):
         """과목 관리 탭 생성"""
@@ -310,7 +134,6 @@ class DataManagerGUI:
         
         self.subj_list = ctk.CTkTextbox(list_frame, width=400, height=200)
         self.subj_list.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        self.update_subject_list()
 
     def create_school_data_tab(self):
         """학교 데이터 관리 탭 생성"""
@@ -348,7 +171,43 @@ class DataManagerGUI:
         list_frame.grid_rowconfigure(0, weight=1)
         self.school_data_list = ctk.CTkTextbox(list_frame, width=600, height=200)
         self.school_data_list.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        self.update_school_data_list()
+
+    def _run_in_background(self, work, on_success, error_message):
+        """CSV 쓰기를 작업 스레드에서 실행하고, 결과 처리는 메인 루프로 넘김
+        Args:
+            work (callable): 작업 스레드에서 실행할 함수
+            on_success (callable): 완료 후 메인 루프에서 실행할 함수
+            error_message (str): 실패 시 표시할 메시지
+        """
+        def worker():
+            # 작업 스레드에서는 Tk를 호출하지 않고 결과 콜백만 큐에 넣음
+            try:
+                with self._write_lock:
+                    work()
+            except Exception as e:
+                self._results.put(lambda err=str(e): messagebox.showerror("오류", f"{error_message}: {err}"))
+                return
+            self._results.put(on_success)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self._pending += 1
+        if self._pending == 1:
+            self.parent.after(_RESULT_POLL_MS, self._drain_results)
+
+    def _drain_results(self):
+        """작업 스레드가 넣은 결과 콜백을 메인 루프에서 실행 (남은 작업이 있으면 다시 예약)"""
+        while True:
+            try:
+                callback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"작업 결과 처리 중 오류 발생: {str(e)}")
+        if self._pending > 0:
+            self.parent.after(_RESULT_POLL_MS, self._drain_results)
 
     def add_location(self):
         """위치 추가"""
@@ -358,101 +217,132 @@ class DataManagerGUI:
             room = self.loc_room.get()
             x = float(self.loc_x.get())
             y = float(self.loc_y.get())
-            
-            # 기존 데이터 로드
-            df = pd.read_csv('data/locations.csv')
-            
-            # 새 위치 추가
-            new_row = pd.DataFrame({
-                'building': [building],
-                'floor': [floor],
-                'room_number': [room],
-                'x_coord': [x],
-                'y_coord': [y]
+        except Exception as e:
+            messagebox.showerror("오류", f"위치 추가 중 오류가 발생했습니다: {str(e)}")
+            return
+
+        def work():
+            # 새 위치를 CSV 파일 끝에 추가 (로더 캐시에도 같은 행이 붙으므로 다시 파싱하지 않음)
+            self.loader.append_csv('locations', {
+                'building': building,
+                'floor': floor,
+                'room_number': room,
+                'x_coord': x,
+                'y_coord': y
             })
-            df = pd.concat([df, new_row], ignore_index=True)
-            
-            # CSV 파일에 저장
-            df.to_csv('data/locations.csv', index=False)
-            
+
+        def on_success():
             # UI 업데이트
             self.update_location_list()
             self.clear_location_inputs()
             
-            # 부모에게 데이터 재로드 요청
-            if hasattr(self.parent, 'route_opt'):
-                self.parent.route_opt.locations = self.loader.load_csv('locations').to_dict('records')
-                self.parent.route_opt.graph = self.parent.route_opt.build_graph(self.parent.route_opt.locations)
+            # 경로 최적화기에는 새 위치만 추가 (그래프 전체를 다시 만들지 않음)
+            self.route_opt.add_location({
+                'building': building,
+                'floor': floor,
+                'room_number': room,
+                'x_coord': x,
+                'y_coord': y
+            })
             
             messagebox.showinfo("성공", "위치가 추가되었습니다.")
-        except Exception as e:
-            messagebox.showerror("오류", f"위치 추가 중 오류가 발생했습니다: {str(e)}")
+
+        self._run_in_background(work, on_success, "위치 추가 중 오류가 발생했습니다")
 
     def add_subject(self):
         """과목 추가"""
-        try:
-            subject = self.subj_name.get()
-            teacher = self.subj_teacher.get()
-            classes = self.subj_classes.get()
-            df = pd.read_csv('data/school_data.csv')
-            new_row = pd.DataFrame({'과목': [subject], '선생님': [teacher], '담당 반': [classes], '담당 교실': ['']})
-            df = pd.concat([df, new_row], ignore_index=True)
-            df.to_csv('data/school_data.csv', index=False)
+        subject = self.subj_name.get()
+        teacher = self.subj_teacher.get()
+        classes = self.subj_classes.get()
+
+        def on_success():
             self.update_subject_list()
             self.clear_subject_inputs()
             messagebox.showinfo("성공", "과목이 추가되었습니다.")
-        except Exception as e:
-            messagebox.showerror("오류", f"과목 추가 중 오류가 발생했습니다: {str(e)}")
+
+        self._run_in_background(
+            lambda: self.loader.append_csv('school_data', {'과목': subject, '선생님': teacher, '담당 반': classes, '담당 교실': ''}),
+            on_success, "과목 추가 중 오류가 발생했습니다")
 
     def add_school_data(self):
         """학교 데이터 추가"""
-        try:
-            teacher = self.sd_teacher.get()
-            subject = self.sd_subject.get()
-            room = self.sd_room.get()
-            classes = self.sd_classes.get()
-            df = pd.read_csv('data/school_data.csv')
-            new_row = pd.DataFrame({'선생님': [teacher], '과목': [subject], '담당 교실': [room], '담당 반': [classes]})
-            df = pd.concat([df, new_row], ignore_index=True)
-            df.to_csv('data/school_data.csv', index=False)
+        teacher = self.sd_teacher.get()
+        subject = self.sd_subject.get()
+        room = self.sd_room.get()
+        classes = self.sd_classes.get()
+
+        def on_success():
             self.update_school_data_list()
             self.clear_school_data_inputs()
             messagebox.showinfo("성공", "데이터가 추가되었습니다.")
-        except Exception as e:
-            messagebox.showerror("오류", f"데이터 추가 중 오류가 발생했습니다: {str(e)}")
+
+        self._run_in_background(
+            lambda: self.loader.append_csv('school_data', {'선생님': teacher, '과목': subject, '담당 교실': room, '담당 반': classes}),
+            on_success, "데이터 추가 중 오류가 발생했습니다")
+
+    def _is_shown(self, textbox, df):
+        """텍스트박스가 이미 df의 현재 내용을 표시하고 있는지 확인"""
+        shown = self._shown.get(textbox)
+        return shown is not None and shown[0] is df and shown[1] == len(df)
+
+    def _set_text(self, textbox, lines, source=None):
+        """텍스트박스 내용을 주어진 줄들로 교체 (insert는 한 번만 호출)
+        Args:
+            textbox: 내용을 바꿀 CTkTextbox
+            lines (list): 표시할 줄 목록
+            source (pandas.DataFrame): 줄을 만든 DataFrame (변경 여부 확인용)
+        """
+        # 읽기 전용 상태를 잠시 풀고 내용을 교체한 뒤 다시 잠금
+        textbox.configure(state="normal")
+        textbox.delete("1.0", "end")
+        if source is not None and len(source) > len(lines):
+            # 표시 개수를 넘는 행은 개수만 안내
+            lines = lines + [f"... 외 {len(source) - len(lines)}개"]
+        if lines:
+            textbox.insert("end", "\n".join(lines) + "\n")
+        textbox.configure(state="disabled")
+        self._shown[textbox] = (source, len(source)) if source is not None else None
 
     def update_location_list(self):
         """위치 목록 업데이트"""
         try:
-            df = pd.read_csv('data/locations.csv')
-            self.loc_list.delete("1.0", "end")
-            for _, row in df.iterrows():
-                self.loc_list.insert("end", f"건물: {row['building']}, 층: {row['floor']}, 호수: {row['room_number']}\n")
+            # 파일이 바뀌지 않았으면 stat 한 번으로 캐시된 DataFrame을 받음
+            df = self.loader.load_csv('locations')
+            if self._is_shown(self.loc_list, df):
+                return
+            # 행(Series)을 만들지 않고 컬럼 배열을 zip해서 줄 목록 생성
+            head = df.head(_MAX_LIST_ROWS)  # 보이는 만큼만 문자열로 만듦
+            lines = [f"건물: {b}, 층: {f}, 호수: {r}" for b, f, r in zip(
+                head['building'].to_numpy(), head['floor'].to_numpy(), head['room_number'].to_numpy())]
+            self._set_text(self.loc_list, lines, source=df)
         except Exception as e:
-            self.loc_list.delete("1.0", "end")
-            self.loc_list.insert("end", f"위치 목록을 불러오는 중 오류가 발생했습니다: {str(e)}")
+            self._set_text(self.loc_list, [f"위치 목록을 불러오는 중 오류가 발생했습니다: {str(e)}"])
 
     def update_subject_list(self):
         """과목 목록 업데이트"""
         try:
-            df = pd.read_csv('data/school_data.csv')
-            self.subj_list.delete("1.0", "end")
-            for _, row in df.iterrows():
-                self.subj_list.insert("end", f"과목: {row['과목']}, 교사: {row['선생님']}, 담당 반: {row['담당 반']}\n")
+            df = self.loader.load_csv('school_data')
+            if self._is_shown(self.subj_list, df):
+                return
+            head = df.head(_MAX_LIST_ROWS)
+            lines = [f"과목: {s}, 교사: {t}, 담당 반: {c}" for s, t, c in zip(
+                head['과목'].to_numpy(), head['선생님'].to_numpy(), head['담당 반'].to_numpy())]
+            self._set_text(self.subj_list, lines, source=df)
         except Exception as e:
-            self.subj_list.delete("1.0", "end")
-            self.subj_list.insert("end", f"과목 목록을 불러오는 중 오류가 발생했습니다: {str(e)}")
+            self._set_text(self.subj_list, [f"과목 목록을 불러오는 중 오류가 발생했습니다: {str(e)}"])
 
     def update_school_data_list(self):
         """학교 데이터 목록 업데이트"""
         try:
-            df = pd.read_csv('data/school_data.csv')
-            self.school_data_list.delete("1.0", "end")
-            for _, row in df.iterrows():
-                self.school_data_list.insert("end", f"{row['선생님']} | {row['과목']} | {row['담당 교실']} | {row['담당 반']}\n")
+            df = self.loader.load_csv('school_data')
+            if self._is_shown(self.school_data_list, df):
+                return
+            head = df.head(_MAX_LIST_ROWS)
+            lines = [f"{t} | {s} | {r} | {c}" for t, s, r, c in zip(
+                head['선생님'].to_numpy(), head['과목'].to_numpy(), head['담당 교실'].to_numpy(), head['담당 반'].to_numpy())]
+            self._set_text(self.school_data_list, lines, source=df)
         except Exception as e:
-            self.school_data_list.delete("1.0", "end")
-            self.school_data_list.insert("end", f"목록을 불러오는 중 오류가 발생했습니다: {str(e)}")
+            self._set_text(self.school_data_list, [f"목록을 불러오는 중 오류가 발생했습니다: {str(e)}"])
 
     def clear_location_inputs(self):
         """위치 입력 필드 초기화"""
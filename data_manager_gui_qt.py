@@ -0,0 +1,298 @@
+# 필요한 라이브러리 임포트
+import pandas as pd
+import os
+import sys
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+                           QHBoxLayout, QPushButton, QFileDialog,
+                           QTableView, QMessageBox)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+import logging
+from data_loader import CSV_DTYPES, parse_cell_value
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+class PandasModel(QAbstractTableModel):
+    """
+    DataFrame을 그대로 참조하는 테이블 모델
+    
+    셀마다 위젯 아이템을 만들지 않고, 화면에 보이는 셀을 그릴 때만 값을 문자열로 변환합니다.
+    """
+    # 입력한 값을 컬럼 타입으로 바꿀 수 없을 때 오류 메시지와 함께 발생
+    edit_failed = pyqtSignal(str)
+    
+    def __init__(self, df=None, parent=None):
+        """
+        Args:
+            df (pandas.DataFrame): 표시할 데이터
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self._set_frame(df)
+        
+    def set_dataframe(self, df):
+        """
+        표시할 DataFrame 교체
+        
+        Args:
+            df (pandas.DataFrame): 새 데이터
+        """
+        # 크기와 컬럼이 같으면 모델을 리셋하지 않고 값만 바뀌었다고 알림
+        # (뷰가 행/열 구조, 선택, 스크롤 위치를 다시 만들지 않음)
+        if (df is not None and df.shape == self._df.shape
+                and df.columns.equals(self._df.columns) and len(df) > 0):
+            self._set_frame(df)
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(df) - 1, len(df.columns) - 1))
+            return
+        self.beginResetModel()
+        self._set_frame(df)
+        self.endResetModel()
+        
+    def _set_frame(self, df):
+        """DataFrame과 셀 조회용 값 배열 저장"""
+        self._df = df if df is not None else pd.DataFrame()
+        # 셀마다 iat을 호출하지 않도록 값을 한 번에 배열로 변환
+        self._values = self._df.to_numpy(dtype=object)
+        # 헤더는 그릴 때마다 Index에서 꺼내지 않도록 문자열 리스트로 보관
+        self._headers = [str(col) for col in self._df.columns]
+        # 빈 셀(NaN/None)은 문자열로 바꾸지 않고 비워 둠
+        self._missing = self._df.isna().to_numpy()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df.columns)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        row, col = index.row(), index.column()
+        if self._missing[row, col]:
+            return None
+        value = self._values[row, col]
+        return value if isinstance(value, str) else str(value)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+        
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        """편집한 값을 DataFrame에 반영"""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        try:
+            # 편집기는 문자열을 넘기므로 숫자 컬럼(int32/float32 등)은 컬럼 타입으로 변환한 뒤 대입
+            self._df.iat[row, col] = parse_cell_value(value, self._df.dtypes.iloc[col])
+            self._values[row, col] = self._df.iat[row, col]
+            self._missing[row, col] = pd.isna(self._values[row, col])
+        except (ValueError, TypeError) as e:
+            logger.error(f"셀 값 변경 실패: {str(e)}")
+            self.edit_failed.emit(f"'{self._headers[col]}' 값을 변경할 수 없습니다: {str(e)}")
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+class DataManagerGUI(QMainWindow):
+    """
+    데이터 관리 GUI 클래스
+    
+    이 클래스는 데이터 관리 기능을 위한 그래픽 사용자 인터페이스를 제공합니다.
+    데이터 로드, 저장, 편집 등의 기능을 포함합니다.
+    """
+    
+    def __init__(self):
+        """DataManagerGUI 초기화"""
+        super().__init__()
+        self.init_ui()
+        self.data = None
+        self.current_file = None
+        
+    def init_ui(self):
+        """사용자 인터페이스 초기화"""
+        # 메인 윈도우 설정
+        self.setWindowTitle('데이터 관리 시스템')
+        self.setGeometry(100, 100, 800, 600)
+        
+        # 중앙 위젯 생성
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # 메인 레이아웃 설정
+        layout = QVBoxLayout(central_widget)
+        
+        # 버튼 레이아웃 생성
+        button_layout = QHBoxLayout()
+        
+        # 데이터 로드 버튼
+        self.load_button = QPushButton('데이터 로드')
+        self.load_button.clicked.connect(self.load_data)
+        button_layout.addWidget(self.load_button)
+        
+        # 데이터 저장 버튼
+        self.save_button = QPushButton('데이터 저장')
+        self.save_button.clicked.connect(self.save_data)
+        button_layout.addWidget(self.save_button)
+        
+        # 데이터 편집 버튼
+        self.edit_button = QPushButton('데이터 편집')
+        self.edit_button.clicked.connect(self.edit_data)
+        button_layout.addWidget(self.edit_button)
+        
+        # 버튼 레이아웃을 메인 레이아웃에 추가
+        layout.addLayout(button_layout)
+        
+        # 데이터 테이블 생성 (DataFrame을 직접 참조하는 모델 사용)
+        self.table = QTableView()
+        self.model = PandasModel()
+        self.model.edit_failed.connect(lambda message: QMessageBox.warning(self, '경고', message))
+        self.table.setModel(self.model)
+        # 전체 컬럼을 훑는 resizeColumnsToContents 대신 고정 폭 사용
+        self.table.horizontalHeader().setDefaultSectionSize(120)
+        layout.addWidget(self.table)
+        
+        # 상태 표시줄 생성
+        self.statusBar().showMessage('준비')
+        
+    def load_data(self):
+        """데이터 파일 로드"""
+        try:
+            # 파일 선택 대화상자 표시
+            file_name, _ = QFileDialog.getOpenFileName(
+                self,
+                "데이터 파일 선택",
+                "",
+                "CSV 파일 (*.csv);;Excel 파일 (*.xlsx *.xls);;모든 파일 (*.*)"
+            )
+            
+            if file_name:
+                # 파일 확장자에 따라 데이터 로드
+                if file_name.endswith('.csv'):
+                    # 알려진 파일(locations, school_data)은 컬럼 타입을 지정해 타입 추론 생략
+                    dtype = CSV_DTYPES.get(os.path.splitext(os.path.basename(file_name))[0])
+                    self.data = pd.read_csv(file_name, dtype=dtype)
+                elif file_name.endswith(('.xlsx', '.xls')):
+                    self.data = pd.read_excel(file_name)
+                else:
+                    QMessageBox.warning(self, '경고', '지원하지 않는 파일 형식입니다.')
+                    return
+                    
+                # 테이블 업데이트
+                self.update_table()
+                self.current_file = file_name
+                self.statusBar().showMessage(f'파일 로드됨: {file_name}')
+                logger.info(f"데이터 파일 로드 완료: {file_name}")
+                
+        except Exception as e:
+            QMessageBox.critical(self, '오류', f'데이터 로드 중 오류 발생: {str(e)}')
+            logger.error(f"데이터 로드 중 오류 발생: {str(e)}")
+            
+    def save_data(self):
+        """데이터 파일 저장"""
+        try:
+            if self.data is None:
+                QMessageBox.warning(self, '경고', '저장할 데이터가 없습니다.')
+                return
+                
+            # 파일 저장 대화상자 표시
+            file_name, _ = QFileDialog.getSaveFileName(
+                self,
+                "데이터 저장",
+                "",
+                "CSV 파일 (*.csv);;Excel 파일 (*.xlsx);;모든 파일 (*.*)"
+            )
+            
+            if file_name:
+                # 파일 확장자에 따라 데이터 저장
+                if file_name.endswith('.csv'):
+                    self.data.to_csv(file_name, index=False)
+                elif file_name.endswith('.xlsx'):
+                    self.data.to_excel(file_name, index=False)
+                else:
+                    QMessageBox.warning(self, '경고', '지원하지 않는 파일 형식입니다.')
+                    return
+                    
+                self.current_file = file_name
+                self.statusBar().showMessage(f'파일 저장됨: {file_name}')
+                logger.info(f"데이터 파일 저장 완료: {file_name}")
+                
+        except Exception as e:
+            QMessageBox.critical(self, '오류', f'데이터 저장 중 오류 발생: {str(e)}')
+            logger.error(f"데이터 저장 중 오류 발생: {str(e)}")
+            
+    def edit_data(self):
+        """데이터 편집"""
+        try:
+            if self.data is None:
+                QMessageBox.warning(self, '경고', '편집할 데이터가 없습니다.')
+                return
+                
+            # 편집 모드 활성화
+            self.table.setEditTriggers(QTableView.DoubleClicked)
+            self.statusBar().showMessage('편집 모드 활성화')
+            logger.info("데이터 편집 모드 활성화")
+            
+        except Exception as e:
+            QMessageBox.critical(self, '오류', f'데이터 편집 중 오류 발생: {str(e)}')
+            logger.error(f"데이터 편집 중 오류 발생: {str(e)}")
+            
+    def update_table(self):
+        """테이블 위젯 업데이트"""
+        try:
+            if self.data is None:
+                return
+                
+            # 교체하는 동안 정렬/다시 그리기를 멈췄다가 끝나면 한 번만 그림
+            sorting = self.table.isSortingEnabled()
+            self.table.setSortingEnabled(False)
+            self.table.setUpdatesEnabled(False)
+            try:
+                # 모델이 DataFrame을 참조하므로 교체만 하면 보이는 셀만 다시 그려짐
+                self.model.set_dataframe(self.data)
+            finally:
+                self.table.setUpdatesEnabled(True)
+                self.table.setSortingEnabled(sorting)
+            logger.info("테이블 업데이트 완료")
+            
+        except Exception as e:
+            QMessageBox.critical(self, '오류', f'테이블 업데이트 중 오류 발생: {str(e)}')
+            logger.error(f"테이블 업데이트 중 오류 발생: {str(e)}")
+            
+    def closeEvent(self, event):
+        """
+        프로그램 종료 시 처리
+        
+        Args:
+            event: 종료 이벤트
+        """
+        reply = QMessageBox.question(
+            self,
+            '종료 확인',
+            '프로그램을 종료하시겠습니까?',
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            event.accept()
+            logger.info("프로그램 종료")
+        else:
+            event.ignore()
+            
+def main():
+    """메인 함수"""
+    app = QApplication(sys.argv)
+    window = DataManagerGUI()
+    window.show()
+    sys.exit(app.exec_())
+
+if __name__ == '__main__':
+    main()
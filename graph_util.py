@@ -1,37 +1,72 @@
 # 필요한 라이브러리 임포트
 import networkx as nx
 import numpy as np
+from itertools import islice
 from typing import List, Dict, Tuple, Set
 from datetime import datetime, timedelta
 import logging
+import weakref
+
+# CuPy(GPU)는 선택 사항: 설치되어 있으면 큰 거리 행렬 계산에만 사용
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 이 개수 이상의 위치에서만 GPU로 거리 행렬 계산 (작은 행렬은 전송 비용이 더 큼)
+_GPU_MIN_LOCATIONS = 512
+
+# shortest_path 결과 캐시: 그래프 -> {(시작, 도착): 경로}
+# (그래프가 사라지면 항목도 함께 사라지므로 id 재사용 문제가 없음, 그래프를 수정하면 clear_path_cache로 비움)
+_SHORTEST_PATH_CACHE_SIZE = 4096
+_sp_cache: 'weakref.WeakKeyDictionary[nx.Graph, Dict[Tuple, Tuple]]' = weakref.WeakKeyDictionary()
+
 def build_graph(locations):
     """위치 정보를 기반으로 그래프 생성
     Args:
-        locations (List[Location]): Location 객체 리스트
+        locations (LocationsSoA): 컬럼별 배열로 저장된 위치 정보
     Returns:
         nx.Graph: 거리와 계단 수를 가중치로 하는 완전 연결 그래프
     """
     G = nx.Graph()
-    # 노드 추가
-    for loc in locations:
-        G.add_node(loc.room_number, 
-                  building=loc.building,
-                  floor=loc.floor,
-                  x_coord=loc.x_coord,
-                  y_coord=loc.y_coord)
-    # 엣지 추가 (거리와 계단 수를 고려한 가중치)
-    for i, a in enumerate(locations):
-        for b in locations[i+1:]:
-            dist = ((a.x_coord-b.x_coord)**2 + (a.y_coord-b.y_coord)**2)**0.5
-            stairs = abs(a.floor-b.floor)
-            weight = dist + stairs * 5  # 계단 가중치(예시)
-            G.add_edge(a.room_number, b.room_number, weight=weight)
+    # 행마다 LocationView를 만들지 않고 컬럼 배열을 그대로 사용
+    rooms = locations.rooms.tolist()
+    xs = locations.xs.tolist()
+    ys = locations.ys.tolist()
+    floors = locations.floors.tolist()
+    # 노드 추가 (한 번에)
+    G.add_nodes_from((room, {'building': building, 'floor': floor, 'x_coord': x, 'y_coord': y})
+                     for room, building, floor, x, y
+                     in zip(rooms, locations.buildings.tolist(), floors, xs, ys))
+    # 엣지 추가 (거리와 계단 수를 고려한 가중치, 모든 쌍을 한 번에 계산)
+    iu, ju, weights = _pairwise_weights(locations.xs.astype(np.float64),
+                                        locations.ys.astype(np.float64),
+                                        locations.floors.astype(np.float64))
+    G.add_weighted_edges_from(zip([rooms[i] for i in iu], [rooms[j] for j in ju], weights.tolist()))
     return G
 
+def _pairwise_weights(x, y, floors):
+    """모든 위치 쌍(i < j)의 엣지 가중치 계산
+    Args:
+        x (np.ndarray): x 좌표 (float64)
+        y (np.ndarray): y 좌표 (float64)
+        floors (np.ndarray): 층 (float64)
+    Returns:
+        tuple: (i 인덱스, j 인덱스, float32 가중치) 1차원 배열
+    """
+    # n×n 행렬 대신 위쪽 삼각형 쌍만 1차원으로 계산하고, 임시 배열은 제자리 연산으로 재사용
+    iu, ju = np.triu_indices(len(x), 1)
+    weights = np.hypot(x[iu] - x[ju], y[iu] - y[ju])
+    stairs = np.subtract(floors[iu], floors[ju])
+    np.abs(stairs, out=stairs)
+    stairs *= 5  # 계단 가중치(예시)
+    weights += stairs
+    # 교실 좌표에는 float32 이상의 정밀도가 의미 없으므로 가중치 배열을 절반 크기로 저장
+    return iu, ju, weights.astype(np.float32)
+
 def shortest_path(G, start, end):
     """두 노드 간의 최단 경로 계산
     Args:
@@ -41,7 +76,33 @@ def shortest_path(G, start, end):
     Returns:
         list: 최단 경로 노드 리스트
     """
-    return nx.shortest_path(G, start, end, weight='weight')
+    cache = _sp_cache.setdefault(G, {})
+    path = cache.get((start, end))
+    if path is None:
+        path = tuple(nx.shortest_path(G, start, end, weight='weight'))
+        if len(cache) >= _SHORTEST_PATH_CACHE_SIZE:
+            cache.clear()
+        cache[(start, end)] = path
+    return list(path)
+
+def clear_path_cache(G):
+    """그래프의 노드/엣지를 바꾼 뒤 호출해 shortest_path 캐시를 비움
+    Args:
+        G (nx.Graph): 수정된 그래프
+    """
+    _sp_cache.pop(G, None)
+
+def shortest_path_length(G, start, end):
+    """두 노드 간 최단 경로의 총 가중치 계산
+    Args:
+        G (nx.Graph): 그래프
+        start: 시작 노드
+        end: 도착 노드
+    Returns:
+        float: 최단 경로의 가중치 합
+    """
+    path = shortest_path(G, start, end)
+    return sum(G[u][v]['weight'] for u, v in zip(path, path[1:]))
 
 class GraphUtil:
     """
@@ -72,32 +133,24 @@ class GraphUtil:
             self.graph.clear()
             self.location_map.clear()
             
-            # 노드 추가
-            for location in locations:
-                node_id = location['id']
-                self.graph.add_node(
-                    node_id,
-                    name=location['name'],
-                    type=location['type'],
-                    coordinates=location['coordinates']
-                )
-                self.location_map[node_id] = node_id
+            # dict 목록을 한 번만 순회해 컬럼별 배열(SoA)로 변환
+            ids, names, types, coordinates, coords = self._to_soa(locations)
+            
+            # 노드 추가 (한 번에)
+            self.graph.add_nodes_from(
+                (node_id, {'name': name, 'type': loc_type, 'coordinates': coordinate})
+                for node_id, name, loc_type, coordinate in zip(ids, names, types, coordinates)
+            )
+            self.location_map.update(zip(ids, ids))
                 
-            # 엣지 추가
-            for i, loc1 in enumerate(locations):
-                for j, loc2 in enumerate(locations[i+1:], i+1):
-                    # 위치 간 거리 계산
-                    distance = self._calculate_distance(
-                        loc1['coordinates'],
-                        loc2['coordinates']
-                    )
-                    
-                    # 엣지 추가 (거리를 가중치로 사용)
-                    self.graph.add_edge(
-                        loc1['id'],
-                        loc2['id'],
-                        weight=distance
-                    )
+            # 위치 간 거리 행렬을 한 번에 계산
+            distances = self._haversine_matrix(coords)
+            
+            # 엣지 추가 (거리를 가중치로 사용, 모든 쌍을 한 번에)
+            iu, ju = np.triu_indices(len(ids), 1)
+            self.graph.add_weighted_edges_from(
+                zip([ids[i] for i in iu], [ids[j] for j in ju], distances[iu, ju].tolist())
+            )
                     
             logger.info(f"그래프 생성 완료: {len(locations)}개 노드")
             return self.graph
@@ -124,46 +177,32 @@ class GraphUtil:
             self.directed_graph.clear()
             self.location_map.clear()
             
-            # 노드 추가
-            for location in locations:
-                node_id = location['id']
-                self.directed_graph.add_node(
-                    node_id,
-                    name=location['name'],
-                    type=location['type'],
-                    coordinates=location['coordinates']
-                )
-                self.location_map[node_id] = node_id
+            # dict 목록을 한 번만 순회해 컬럼별 배열(SoA)로 변환
+            ids, names, types, coordinates, coords = self._to_soa(locations)
+            
+            # 노드 추가 (한 번에)
+            self.directed_graph.add_nodes_from(
+                (node_id, {'name': name, 'type': loc_type, 'coordinates': coordinate})
+                for node_id, name, loc_type, coordinate in zip(ids, names, types, coordinates)
+            )
+            self.location_map.update(zip(ids, ids))
                 
-            # 엣지 추가
-            for i, loc1 in enumerate(locations):
-                for j, loc2 in enumerate(locations):
-                    if i != j:  # 자기 자신으로의 엣지는 제외
-                        # 시간 제약 확인
-                        if time_windows:
-                            if not self._check_time_constraint(
-                                loc1['id'],
-                                loc2['id'],
-                                time_windows
-                            ):
-                                continue
-                                
-                        # 위치 간 거리 계산
-                        distance = self._calculate_distance(
-                            loc1['coordinates'],
-                            loc2['coordinates']
-                        )
-                        
-                        # 이동 시간 계산 (거리 기반)
-                        travel_time = self._calculate_travel_time(distance)
-                        
-                        # 엣지 추가 (이동 시간을 가중치로 사용)
-                        self.directed_graph.add_edge(
-                            loc1['id'],
-                            loc2['id'],
-                            weight=travel_time
-                        )
-                        
+            # 위치 간 거리 행렬과 이동 시간 행렬을 한 번에 계산
+            distances = self._haversine_matrix(coords)
+            travel_times = self._calculate_travel_time(distances)
+            
+            # 시간 제약 확인 (모든 쌍을 배열 비교로 한 번에)
+            n = len(ids)
+            allowed = (self._time_constraint_mask(ids, travel_times, time_windows)
+                       if time_windows else np.ones((n, n), dtype=bool))
+            # 자기 자신으로의 엣지는 제외
+            np.fill_diagonal(allowed, False)
+            
+            # 엣지 추가 (이동 시간을 가중치로 사용, 허용된 쌍을 한 번에)
+            ii, jj = np.nonzero(allowed)
+            self.directed_graph.add_weighted_edges_from(
+                zip([ids[i] for i in ii], [ids[j] for j in jj], travel_times[ii, jj].tolist())
+            )
             logger.info(f"방향성 그래프 생성 완료: {len(locations)}개 노드")
             return self.directed_graph
             
@@ -212,30 +251,34 @@ class GraphUtil:
     def find_all_shortest_paths(self,
                                start_id: str,
                                end_id: str,
-                               weight: str = 'weight') -> List[List[str]]:
+                               weight: str = 'weight',
+                               k: int = 5) -> List[List[str]]:
         """
-        두 위치 간의 모든 최단 경로 탐색
+        두 위치 간의 짧은 순서대로 최대 k개의 경로 탐색
         
         Args:
             start_id (str): 시작 위치 ID
             end_id (str): 도착 위치 ID
             weight (str): 가중치 속성 이름
+            k (int): 반환할 최대 경로 수
             
         Returns:
-            List[List[str]]: 모든 최단 경로 목록
+            List[List[str]]: 최단 경로 목록 (짧은 순)
         """
         try:
+            if k <= 0:
+                return []
             if not self.graph.has_node(start_id) or not self.graph.has_node(end_id):
                 logger.error(f"존재하지 않는 노드: {start_id} 또는 {end_id}")
                 return []
                 
-            # Yen's K-Shortest Paths 알고리즘을 사용한 모든 최단 경로 탐색
-            paths = list(nx.shortest_simple_paths(
+            # Yen's K-Shortest Paths 알고리즘 (모든 단순 경로를 나열하지 않고 k개에서 중단)
+            paths = list(islice(nx.shortest_simple_paths(
                 self.graph,
                 source=start_id,
                 target=end_id,
                 weight=weight
-            ))
+            ), k))
             
             logger.info(f"모든 최단 경로 탐색 완료: {start_id} -> {end_id}")
             return paths
@@ -277,32 +320,34 @@ class GraphUtil:
                 return []
                 
             # 위치 간 거리 행렬 계산
+            # (Floyd-Warshall로 전체 최단 거리를 한 번에 구한 뒤 필요한 행/열만 추출)
             n = len(locations)
-            distance_matrix = np.zeros((n, n))
-            
-            for i, loc1 in enumerate(locations):
-                for j, loc2 in enumerate(locations):
-                    if i != j:
-                        path = self.find_shortest_path(loc1, loc2)
-                        if path:
-                            # 경로의 총 거리 계산
-                            total_distance = sum(
-                                self.graph[path[k]][path[k+1]]['weight']
-                                for k in range(len(path)-1)
-                            )
-                            distance_matrix[i, j] = total_distance
-                        else:
-                            distance_matrix[i, j] = float('inf')
+            distance_matrix = np.full((n, n), float('inf'))
+            
+            nodes = list(self.graph.nodes)
+            node_index = {node: i for i, node in enumerate(nodes)}
+            missing = [loc for loc in locations if loc not in node_index]
+            if missing:
+                logger.error(f"존재하지 않는 노드: {', '.join(map(str, missing))}")
+            known = np.array([loc in node_index for loc in locations], dtype=bool)
+            if known.any():
+                all_pairs = nx.floyd_warshall_numpy(self.graph, nodelist=nodes, weight='weight')
+                idx = np.array([node_index[loc] for loc in locations if loc in node_index])
+                distance_matrix[np.ix_(known, known)] = all_pairs[np.ix_(idx, idx)]
+            np.fill_diagonal(distance_matrix, 0.0)
                             
             # 시작/도착 위치가 지정된 경우 처리
             if start_id and end_id:
-                start_idx = locations.index(start_id)
-                end_idx = locations.index(end_id)
+                # 위치 -> 인덱스 (list.index와 같이 처음 나온 위치 기준)
+                location_index = {}
+                for i, loc in enumerate(locations):
+                    location_index.setdefault(loc, i)
                 
                 # 시작/도착 위치를 제외한 나머지 위치들에 대해 TSP 해결
-                remaining_locations = [loc for loc in locations if loc not in [start_id, end_id]]
+                endpoints = {start_id, end_id}
+                remaining_locations = [loc for loc in locations if loc not in endpoints]
                 if remaining_locations:
-                    remaining_indices = [locations.index(loc) for loc in remaining_locations]
+                    remaining_indices = [location_index[loc] for loc in remaining_locations]
                     sub_matrix = distance_matrix[remaining_indices][:, remaining_indices]
                     
                     # TSP 해결
@@ -326,6 +371,23 @@ class GraphUtil:
             logger.error(f"최적 경로 탐색 중 오류 발생: {str(e)}")
             return []
             
+    def _to_soa(self, locations: List[Dict]) -> Tuple[List, List, List, List, np.ndarray]:
+        """
+        위치 dict 목록을 컬럼별 배열(Structure of Arrays)로 변환
+        
+        Args:
+            locations (List[Dict]): 위치 정보 목록
+            
+        Returns:
+            Tuple: (ID 목록, 이름 목록, 유형 목록, 원본 좌표 목록, (n, 2) float64 좌표 배열)
+        """
+        ids = [location['id'] for location in locations]
+        names = [location['name'] for location in locations]
+        types = [location['type'] for location in locations]
+        coordinates = [location['coordinates'] for location in locations]
+        coords = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        return ids, names, types, coordinates, coords
+        
     def _calculate_distance(self,
                           coord1: Tuple[float, float],
                           coord2: Tuple[float, float]) -> float:
@@ -357,6 +419,38 @@ class GraphUtil:
         
         return distance
         
+    def _haversine_matrix(self, coords) -> np.ndarray:
+        """
+        모든 좌표 쌍 간의 거리 행렬 계산 (Haversine 공식)
+        
+        Args:
+            coords: 좌표 (위도, 경도) 목록
+            
+        Returns:
+            np.ndarray: n×n 거리 행렬 (km)
+        """
+        # 지구 반경 (km)
+        R = 6371.0
+        
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        # 위치가 많고 CuPy가 있으면 같은 계산을 GPU에서 수행
+        xp = cp if cp is not None and len(coords) >= _GPU_MIN_LOCATIONS else np
+        
+        # 라디안 변환과 삼각함수는 좌표마다 한 번만 계산
+        coords = xp.radians(xp.asarray(coords))
+        lat, lon = coords[:, 0], coords[:, 1]
+        cos_lat = xp.cos(lat)
+        
+        # 위도와 경도의 차이 (브로드캐스팅)
+        dlat = lat[None, :] - lat[:, None]
+        dlon = lon[None, :] - lon[:, None]
+        
+        # Haversine 공식
+        a = xp.sin(dlat/2)**2 + cos_lat[:, None] * cos_lat[None, :] * xp.sin(dlon/2)**2
+        c = 2 * xp.arctan2(xp.sqrt(a), xp.sqrt(1-a))
+        distances = R * c
+        return cp.asnumpy(distances) if xp is not np else distances
+        
     def _calculate_travel_time(self, distance: float) -> float:
         """
         거리 기반 이동 시간 계산
@@ -373,8 +467,8 @@ class GraphUtil:
         # 이동 시간 계산 (분)
         travel_time = (distance / base_speed) * 60
         
-        # 교통 상황에 따른 추가 시간 (임의의 값)
-        traffic_factor = np.random.uniform(1.0, 1.5)
+        # 교통 상황에 따른 추가 시간 (1.0~1.5배의 평균값으로 고정해 가중치를 결정적으로 유지)
+        traffic_factor = 1.25
         travel_time *= traffic_factor
         
         return travel_time
@@ -411,6 +505,37 @@ class GraphUtil:
         arrival_time = from_start + timedelta(minutes=travel_time)
         return to_start <= arrival_time <= to_end
         
+    def _time_constraint_mask(self,
+                              ids: List[str],
+                              travel_times: np.ndarray,
+                              time_windows: Dict[str, Tuple[datetime, datetime]]) -> np.ndarray:
+        """
+        모든 위치 쌍에 대한 시간 제약 조건 확인 (_check_time_constraint의 배열 버전)
+        
+        Args:
+            ids (List[str]): 위치 ID 목록
+            travel_times (np.ndarray): n×n 이동 시간 행렬 (분)
+            time_windows (Dict[str, Tuple[datetime, datetime]]): 시간대 정보
+            
+        Returns:
+            np.ndarray: n×n 불리언 행렬 (True면 i -> j 이동 가능)
+        """
+        has_window = np.array([node_id in time_windows for node_id in ids], dtype=bool)
+        if not has_window.any():
+            return np.ones(travel_times.shape, dtype=bool)
+            
+        # 시간대가 없는 위치는 임의의 값으로 채우고 마지막에 제약 없음으로 처리
+        placeholder = (datetime.min, datetime.min)
+        windows = [time_windows.get(node_id, placeholder) for node_id in ids]
+        starts = np.array([start for start, _ in windows], dtype='datetime64[us]')
+        ends = np.array([end for _, end in windows], dtype='datetime64[us]')
+        
+        # 도착 시간이 도착 위치의 시간대 내에 있는지 확인
+        travel = np.round(travel_times * 60_000_000).astype('timedelta64[us]')
+        arrival = starts[:, None] + travel
+        in_window = (starts[None, :] <= arrival) & (arrival <= ends[None, :])
+        return in_window | ~(has_window[:, None] & has_window[None, :])
+        
     def _solve_tsp(self, distance_matrix: np.ndarray) -> List[int]:
         """
         외판원 문제(TSP) 해결
@@ -429,25 +554,26 @@ class GraphUtil:
         best_route = list(range(n))
         best_distance = float('inf')
         
+        distance_matrix = np.asarray(distance_matrix, dtype=float)
+        
         # 시작점을 기준으로 최적 경로 탐색
         for start_idx in range(n):
             current_route = [start_idx]
-            unvisited = list(range(start_idx)) + list(range(start_idx+1, n))
+            # 방문 여부를 불리언 마스크로 관리하고 가장 가까운 위치는 argmin으로 선택
+            visited = np.zeros(n, dtype=bool)
+            visited[start_idx] = True
             
-            while unvisited:
+            for _ in range(n - 1):
                 current = current_route[-1]
-                next_idx = min(
-                    unvisited,
-                    key=lambda x: distance_matrix[current][x]
-                )
+                next_idx = int(np.argmin(np.where(visited, np.inf, distance_matrix[current])))
+                if visited[next_idx]:
+                    # 남은 위치가 모두 도달 불가(inf)이면 첫 번째 미방문 위치 선택
+                    next_idx = int(np.argmin(visited))
                 current_route.append(next_idx)
-                unvisited.remove(next_idx)
+                visited[next_idx] = True
                 
             # 경로의 총 거리 계산
-            total_distance = sum(
-                distance_matrix[current_route[i]][current_route[i+1]]
-                for i in range(len(current_route)-1)
-            )
+            total_distance = distance_matrix[current_route[:-1], current_route[1:]].sum()
             
             if total_distance < best_distance:
                 best_distance = total_distance
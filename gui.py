@@ -1,16 +1,15 @@
 import customtkinter as ctk
-from visualizer import plot_timetable, plot_route
 from data_manager_gui import DataManagerGUI
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.font_manager as fm
+# matplotlib/pandas/visualizer는 시각화할 때만 필요하므로 사용하는 곳에서 임포트 (시작 시간 단축)
 import os
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 import random
+import time
 from datetime import datetime
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 from PIL import Image
 import sys
@@ -25,6 +24,22 @@ import logging
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 시간표 생성 입력 파일과 생성 결과 캐시 파일 (data 디렉토리 기준)
+_TIMETABLE_INPUT_FILES = ('school_data.csv', 'locations.csv')
+_TIMETABLE_CACHE_FILE = '.timetable_cache.json'
+
+# 미리 32×32로 줄여 둔 로고 이미지
+_LOGO_PATH = 'data/icon_32.png'
+
+# MainWindow 상태 갱신 타이머 간격 (ms)
+_STATUS_INTERVAL_MS = 1000
+# MainWindow 로그 창에 유지할 최대 줄 수
+_LOG_MAX_BLOCKS = 5000
+# 알람 재생 시 백그라운드 로드를 기다리는 최대 시간 (초)
+_ALARM_WAIT_SEC = 1.0
+# 시간표 이미지 작업 완료를 확인하는 간격 (ms)
+_PLOT_POLL_MS = 50
+
 class AppGUI(ctk.CTk):
     """메인 GUI 애플리케이션 클래스"""
     def __init__(self, scheduler, route_opt, loader):
@@ -53,7 +68,18 @@ class AppGUI(ctk.CTk):
         self.loader = loader
         
         self.selected_class = None
-        self.timetables = None
+        # 여러 탭이 함께 쓰는 시간표 상태 (바뀌면 구독자에게 알림)
+        self._model = {'timetables': None, 'class_list': []}
+        self._model_subs = [self._on_model_changed]
+        self._timetable_cache = {}  # 데이터 파일 수정 시각 -> 생성된 시간표
+        self._scheduler_fingerprint = self._timetable_fingerprint()  # 스케줄러가 읽은 데이터의 수정 시각
+        self._tt_fig = None  # 시간표 시각화에 재사용하는 Figure/Axes
+        self._tt_ax = None
+        self._plot_executor = ThreadPoolExecutor(max_workers=2)  # 시간표 이미지 렌더링용
+        # 시간표/경로 생성 완료 알람 (믹서 초기화가 첫 화면을 막지 않도록 백그라운드에서 로드)
+        self._alarm = None
+        self._alarm_ready = threading.Event()
+        threading.Thread(target=self._load_alarm, daemon=True).start()
         self.class_dropdown = None
         self.timetable_text = None
         
@@ -69,11 +95,18 @@ class AppGUI(ctk.CTk):
         self.create_main_tab()
         self.create_route_tab()
         
+        # 목적지까지의 경로를 백그라운드에서 미리 계산 (경로 생성 클릭 시 캐시에서 바로 응답)
+        threading.Thread(
+            target=self.route_opt.precompute_targets,
+            args=(list(self.destination_dropdown.cget("values")),),
+            daemon=True
+        ).start()
+        
         # 데이터 관리 GUI 생성
-        self.data_manager = DataManagerGUI(self.tab_data, loader)
+        self.data_manager = DataManagerGUI(self.tab_data, loader, self.route_opt)
         
         # 왼쪽 상단에 로고 이미지 삽입
-        logo_img = Image.open("data/icon.png").resize((32, 32))
+        logo_img = self._load_logo()
         self.logo_photo = ctk.CTkImage(light_image=logo_img, dark_image=logo_img, size=(32, 32))
         self.logo_label = ctk.CTkLabel(self, image=self.logo_photo, text="")
         self.logo_label.place(x=10, y=10)
@@ -212,19 +245,123 @@ class AppGUI(ctk.CTk):
 
     def show_timetable(self):
         """시간표 생성 및 표시"""
-        self.timetables = self.scheduler.generate()
-        class_list = sorted(self.timetables.keys(), key=lambda x: int(x) if x.isdigit() else x)
-        self.class_dropdown.configure(values=class_list)
+        timetables = self._generate_timetables()
+        # 같은 시간표(캐시 재사용)면 정렬된 반 목록과 드롭다운을 그대로 재사용
+        if timetables is not self.timetables:
+            # 숫자 반은 숫자 순, 그 외는 뒤에 이름 순 (정렬 키를 미리 계산)
+            keyed = [((int(k), k) if k.isdigit() else (1 << 30, k)) for k in timetables]
+            keyed.sort()
+            self._update_model(timetables=timetables, class_list=[k for _, k in keyed])
+        class_list = self._model['class_list']
         if class_list:
             self.class_dropdown.set(class_list[0])
             self.display_timetable(class_list[0])
         # 시간표 완성 시 알람
+        self._play_alarm()
+
+    def _set_textbox(self, textbox, text):
+        """텍스트 박스 내용 교체 (읽기 전용 상태를 잠시 풀고 한 번에 삽입)
+        Args:
+            textbox (ctk.CTkTextbox): 대상 텍스트 박스
+            text (str): 표시할 내용
+        """
+        textbox.configure(state="normal")
+        textbox.delete("1.0", "end")
+        textbox.insert("end", text)
+        textbox.configure(state="disabled")
+
+    @property
+    def timetables(self):
+        """현재 시간표 (공유 모델에서 읽음)"""
+        return self._model['timetables']
+
+    def _update_model(self, **changes):
+        """공유 모델을 갱신하고 구독자에게 알림"""
+        self._model.update(changes)
+        for callback in self._model_subs:
+            callback(self._model)
+
+    def _on_model_changed(self, model):
+        """반 목록이 바뀌면 두 탭의 반 선택 드롭다운을 함께 갱신"""
+        for dropdown in (self.class_dropdown, self.route_class_dropdown):
+            dropdown.configure(values=model['class_list'])
+
+    def _load_logo(self):
+        """32×32 로고 이미지 로드 (미리 줄여 둔 파일이 없으면 한 번 만들어 저장)"""
+        if not os.path.exists(_LOGO_PATH):
+            logo_img = Image.open("data/icon.png").resize((32, 32))
+            try:
+                logo_img.save(_LOGO_PATH)
+            except OSError as e:
+                logger.error(f"로고 이미지 저장 실패: {str(e)}")
+            return logo_img
+        return Image.open(_LOGO_PATH)
+
+    def _load_alarm(self):
+        """믹서를 초기화하고 알람 소리를 한 번만 읽어서 디코딩해 둠 (실패하면 None 유지)"""
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            self._alarm = pygame.mixer.Sound("data/alarm.mp3")
+        except Exception as e:
+            print(f"Alarm sound error: {e}")
+        finally:
+            self._alarm_ready.set()
+
+    def _play_alarm(self):
+        """미리 읽어 둔 알람 소리 재생"""
+        # 아직 로드 중이면 잠시만 기다림
+        if not self._alarm_ready.wait(timeout=_ALARM_WAIT_SEC) or self._alarm is None:
+            return
         try:
-            pygame.mixer.music.load("data/alarm.mp3")
-            pygame.mixer.music.play()
+            self._alarm.play()
         except Exception as e:
             print(f"Alarm sound error: {e}")
 
+    def _timetable_fingerprint(self):
+        """시간표 생성에 쓰이는 데이터 파일의 수정 시각 (같으면 같은 입력으로 간주)"""
+        data_dir = getattr(self.loader, 'data_dir', 'data')
+        stamps = []
+        for file_name in _TIMETABLE_INPUT_FILES:
+            path = os.path.join(data_dir, file_name)
+            stamps.append(os.stat(path).st_mtime_ns if os.path.exists(path) else None)
+        return json.dumps(stamps)
+
+    def _generate_timetables(self):
+        """시간표 생성 (입력 데이터가 그대로면 메모리/디스크에 저장된 결과 재사용)
+        Returns:
+            dict: 반별 시간표
+        """
+        fingerprint = self._timetable_fingerprint()
+        if fingerprint in self._timetable_cache:
+            return self._timetable_cache[fingerprint]
+        
+        cache_path = os.path.join(getattr(self.loader, 'data_dir', 'data'), _TIMETABLE_CACHE_FILE)
+        timetables = None
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('fingerprint') == fingerprint:
+                timetables = cached['timetables']
+        except (OSError, ValueError):
+            pass
+        
+        if timetables is None:
+            # 스케줄러가 읽어 둔 데이터가 현재 파일과 다르면 다시 읽은 뒤 생성
+            # (이전 데이터로 만든 시간표가 새 수정 시각으로 저장되지 않도록)
+            if fingerprint != self._scheduler_fingerprint:
+                self.scheduler.reload()
+                self._scheduler_fingerprint = fingerprint
+            timetables = self.scheduler.generate()
+            try:
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({'fingerprint': fingerprint, 'timetables': timetables}, f, ensure_ascii=False)
+            except (OSError, TypeError) as e:
+                logger.error(f"시간표 캐시 저장 실패: {str(e)}")
+        
+        self._timetable_cache[fingerprint] = timetables
+        return timetables
+
     def on_class_select(self, selected_class):
         """반 선택 시 호출되는 콜백 함수"""
         self.display_timetable(selected_class)
@@ -236,21 +373,19 @@ class AppGUI(ctk.CTk):
         """
         timetable = self.timetables.get(class_num)
         if not timetable:
-            self.timetable_text.delete("1.0", "end")
-            self.timetable_text.insert("end", f"{class_num}반 시간표가 없습니다.")
+            self._set_textbox(self.timetable_text, f"{class_num}반 시간표가 없습니다.")
             return
         days = ['월요일', '화요일', '수요일', '목요일', '금요일']
-        periods = [1,2,3,4,5,6,7]
-        text = f"[{class_num}반 시간표]\n"
+        # 문자열을 반복해서 이어 붙이지 않고 줄 목록을 모아 한 번에 결합
+        lines = [f"[{class_num}반 시간표]"]
         for day in days:
-            text += f"{day}:\n"
-            for i, entry in enumerate(timetable[day]):
+            lines.append(f"{day}:")
+            for i, entry in enumerate(timetable[day], 1):
                 if entry:
-                    text += f"  {i+1}교시: {entry['과목']} ({entry['선생님']}, {entry['교실']})\n"
+                    lines.append(f"  {i}교시: {entry['과목']} ({entry['선생님']}, {entry['교실']})")
                 else:
-                    text += f"  {i+1}교시: -\n"
-        self.timetable_text.delete("1.0", "end")
-        self.timetable_text.insert("end", text)
+                    lines.append(f"  {i}교시: -")
+        self._set_textbox(self.timetable_text, "\n".join(lines) + "\n")
 
     def visualize_selected_timetable(self):
         """선택된 시간표 시각화"""
@@ -263,13 +398,50 @@ class AppGUI(ctk.CTk):
         try:
             print(f"시각화 시도: {class_num}, {save_path}")
             print(f"graph is None? {self.scheduler.graph is None}")
-            from visualizer import plot_timetable
-            plot_timetable(
+            from visualizer import plot_timetable, load_korean_font
+            # 렌더링/JPEG 저장은 작업 스레드에서 독립 Figure(Agg)로 처리해 GUI가 멈추지 않게 함
+            # (폰트는 메인 스레드에서 받아 넘겨 작업 스레드가 plt.rcParams를 건드리지 않게 함)
+            future = self._plot_executor.submit(
+                plot_timetable,
                 timetable,
                 class_name=class_num,
                 graph=self.scheduler.graph,
-                save_path=save_path
+                save_path=save_path,
+                show=False,
+                fontprop=load_korean_font()
             )
+            # Tk는 메인 스레드에서만 다뤄야 하므로 작업 스레드 콜백 대신 메인 루프에서 완료 여부를 확인
+            self.after(_PLOT_POLL_MS, self._poll_plot, future)
+        except Exception as e:
+            print(f"시각화 중 오류: {e}")
+
+    def _poll_plot(self, future):
+        """시간표 이미지 작업이 끝났는지 메인 루프에서 주기적으로 확인
+        Args:
+            future (Future): plot_timetable 작업
+        """
+        if not future.done():
+            self.after(_PLOT_POLL_MS, self._poll_plot, future)
+            return
+        self._on_plot_done(future)
+
+    def _on_plot_done(self, future):
+        """시간표 이미지 저장이 끝나면 메인 스레드에서 창에 표시
+        Args:
+            future (Future): plot_timetable 작업 (저장된 파일 경로 반환)
+        """
+        try:
+            save_path = future.result()
+            import matplotlib.pyplot as plt
+            # 시간표 창이 열려 있으면 같은 Figure를 지우고 다시 그림
+            if self._tt_fig is None or not plt.fignum_exists(self._tt_fig.number):
+                self._tt_fig, self._tt_ax = plt.subplots(figsize=(12, 7))
+            self._tt_ax.clear()
+            self._tt_ax.imshow(plt.imread(save_path))
+            self._tt_ax.axis('off')
+            self._tt_fig.tight_layout()
+            self._tt_fig.canvas.draw_idle()
+            plt.show(block=False)
             print("시각화 완료")
         except Exception as e:
             print(f"시각화 중 오류: {e}")
@@ -288,8 +460,7 @@ class AppGUI(ctk.CTk):
         destination = self.destination_dropdown.get()
 
         if not class_num or not self.timetables or class_num not in self.timetables:
-            self.route_text.delete("1.0", "end")
-            self.route_text.insert("end", "시간표를 먼저 생성해주세요.")
+            self._set_textbox(self.route_text, "시간표를 먼저 생성해주세요.")
             return
 
         timetable = self.timetables[class_num]
@@ -297,8 +468,7 @@ class AppGUI(ctk.CTk):
         if timetable[day][period-1]:
             current_location = timetable[day][period-1]['교실']
         else:
-            self.route_text.delete("1.0", "end")
-            self.route_text.insert("end", f"{period}교시에 수업이 없습니다.")
+            self._set_textbox(self.route_text, f"{period}교시에 수업이 없습니다.")
             return
 
         try:
@@ -309,17 +479,11 @@ class AppGUI(ctk.CTk):
             for i, location in enumerate(path, 1):
                 route_text += f"{i}. {location}\n"
             
-            self.route_text.delete("1.0", "end")
-            self.route_text.insert("end", route_text)
+            self._set_textbox(self.route_text, route_text)
             # 경로 생성 성공 시 알람
-            try:
-                pygame.mixer.music.load("data/alarm.mp3")
-                pygame.mixer.music.play()
-            except Exception as e:
-                print(f"Alarm sound error: {e}")
+            self._play_alarm()
         except Exception as e:
-            self.route_text.delete("1.0", "end")
-            self.route_text.insert("end", f"경로 생성 중 오류가 발생했습니다: {str(e)}")
+            self._set_textbox(self.route_text, f"경로 생성 중 오류가 발생했습니다: {str(e)}")
             
 class MainWindow(QMainWindow):
     """
@@ -332,6 +496,8 @@ class MainWindow(QMainWindow):
     def __init__(self):
         """MainWindow 초기화"""
         super().__init__()
+        self._log_second = None  # 마지막 로그 시각 (초)과 그 시각 문자열
+        self._log_timestamp = ''
         self.init_ui()
         self.setup_connections()
         self.setup_timer()
@@ -526,6 +692,8 @@ class MainWindow(QMainWindow):
         # 로그 표시 영역
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        # 오래된 줄은 버리고 최근 로그만 유지 (메모리와 다시 배치 비용 제한)
+        self.log_text.document().setMaximumBlockCount(_LOG_MAX_BLOCKS)
         layout.addWidget(self.log_text)
         
         # 로그 제어 버튼
@@ -560,33 +728,35 @@ class MainWindow(QMainWindow):
         
     def setup_timer(self):
         """타이머 설정"""
+        # 유휴 상태에서 깨어나지 않도록 시스템이 실행 중일 때만 고정 간격으로 동작
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(1000)  # 1초마다 업데이트
         
     def start_system(self):
         """시스템 시작"""
         try:
             self.status_label.setText('실행 중')
             self.status_label.setStyleSheet('color: #4CAF50;')
+            self.update_timer.start(_STATUS_INTERVAL_MS)
             self.log_message('시스템이 시작되었습니다.')
             logger.info("시스템 시작")
             
         except Exception as e:
             self.log_message(f'시스템 시작 중 오류 발생: {str(e)}')
-            logger.error(f"시스템 시작 중 오류 발생: {str(e)}")
+            logger.error("시스템 시작 중 오류 발생: %s", e)
             
     def stop_system(self):
         """시스템 중지"""
         try:
             self.status_label.setText('중지됨')
             self.status_label.setStyleSheet('color: #f44336;')
+            self.update_timer.stop()
             self.log_message('시스템이 중지되었습니다.')
             logger.info("시스템 중지")
             
         except Exception as e:
             self.log_message(f'시스템 중지 중 오류 발생: {str(e)}')
-            logger.error(f"시스템 중지 중 오류 발생: {str(e)}")
+            logger.error("시스템 중지 중 오류 발생: %s", e)
             
     def pause_system(self):
         """시스템 일시정지"""
@@ -594,17 +764,19 @@ class MainWindow(QMainWindow):
             if self.status_label.text() == '일시정지':
                 self.status_label.setText('실행 중')
                 self.status_label.setStyleSheet('color: #4CAF50;')
+                self.update_timer.start(_STATUS_INTERVAL_MS)
                 self.log_message('시스템이 재개되었습니다.')
                 logger.info("시스템 재개")
             else:
                 self.status_label.setText('일시정지')
                 self.status_label.setStyleSheet('color: #FFC107;')
+                self.update_timer.stop()
                 self.log_message('시스템이 일시정지되었습니다.')
                 logger.info("시스템 일시정지")
                 
         except Exception as e:
             self.log_message(f'시스템 일시정지 중 오류 발생: {str(e)}')
-            logger.error(f"시스템 일시정지 중 오류 발생: {str(e)}")
+            logger.error("시스템 일시정지 중 오류 발생: %s", e)
             
     def save_settings(self):
         """설정 저장"""
@@ -621,11 +793,11 @@ class MainWindow(QMainWindow):
             
             # 설정 저장 로직 구현
             self.log_message('설정이 저장되었습니다.')
-            logger.info(f"설정 저장 완료: {settings}")
+            logger.info("설정 저장 완료: %s", settings)
             
         except Exception as e:
             self.log_message(f'설정 저장 중 오류 발생: {str(e)}')
-            logger.error(f"설정 저장 중 오류 발생: {str(e)}")
+            logger.error("설정 저장 중 오류 발생: %s", e)
             
     def save_log(self):
         """로그 저장"""
@@ -639,16 +811,21 @@ class MainWindow(QMainWindow):
             )
             
             if file_name:
-                # 로그 내용 저장
+                # 로그 내용 저장 (전체 텍스트를 한 문자열로 만들지 않고 줄(블록) 단위로 기록)
                 with open(file_name, 'w', encoding='utf-8') as f:
-                    f.write(self.log_text.toPlainText())
+                    block = self.log_text.document().begin()
+                    while block.isValid():
+                        f.write(block.text())
+                        block = block.next()
+                        if block.isValid():
+                            f.write('\n')
                     
                 self.log_message(f'로그가 저장되었습니다: {file_name}')
-                logger.info(f"로그 저장 완료: {file_name}")
+                logger.info("로그 저장 완료: %s", file_name)
                 
         except Exception as e:
             self.log_message(f'로그 저장 중 오류 발생: {str(e)}')
-            logger.error(f"로그 저장 중 오류 발생: {str(e)}")
+            logger.error("로그 저장 중 오류 발생: %s", e)
             
     def clear_log(self):
         """로그 지우기"""
@@ -663,8 +840,12 @@ class MainWindow(QMainWindow):
         Args:
             message (str): 로그 메시지
         """
-        timestamp = QDateTime.currentDateTime().toString('yyyy-MM-dd hh:mm:ss')
-        self.log_text.append(f'[{timestamp}] {message}')
+        # 같은 초 안의 메시지는 이전에 만든 시각 문자열을 재사용
+        now = int(time.time())
+        if now != self._log_second:
+            self._log_second = now
+            self._log_timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        self.log_text.append(f'[{self._log_timestamp}] {message}')
         
     def update_status(self):
         """상태 업데이트"""
@@ -1,17 +1,45 @@
 # 필요한 라이브러리 임포트
 import pandas as pd
 from models import Subject, Teacher, Location, TimeSlot
+from data_loader import RowView
 from typing import List
 import os
 import json
+from functools import cached_property
 import numpy as np
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from importlib.util import find_spec
+from time import monotonic
 import logging
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# read_csv에 넘길 사용 컬럼과 타입 (타입 추론 생략, 쓰지 않는 컬럼은 읽지 않음)
+_SUBJECT_COLUMNS = ['subject', 'teachers', 'required']
+_SUBJECT_DTYPES = {'subject': str}
+# teachers는 읽으면서 이름 목록으로 변환 (앞뒤 공백 제거, 빈 이름/빈 칸은 제외해 Teacher 이름과 맞춤)
+_SUBJECT_CONVERTERS = {'teachers': lambda v: [name.strip() for name in v.split(',') if name.strip()],
+                       'required': lambda v: v.strip().lower() == 'true'}
+_LOCATION_COLUMNS = ['building', 'floor', 'room_number', 'x_coord', 'y_coord']
+_LOCATION_DTYPES = {'building': str, 'floor': np.int32, 'room_number': str,
+                    'x_coord': np.float32, 'y_coord': np.float32}
+# pyarrow가 설치되어 있으면 멀티스레드 CSV 파서 사용 (converters를 쓰는 파일은 제외)
+_CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+# DataManager 파일 형식별 (읽기, 쓰기) 함수와 확장자별 파일 형식
+_FILE_HANDLERS = {
+    'csv': (lambda path: pd.read_csv(path, engine=_CSV_ENGINE),
+            lambda data, path: data.to_csv(path, index=False)),
+    'json': (pd.read_json,
+             lambda data, path: data.to_json(path, orient='records')),
+    'excel': (pd.read_excel,
+              lambda data, path: data.to_excel(path, index=False)),
+}
+_FILE_TYPES = {'.csv': 'csv', '.json': 'json', '.xlsx': 'excel', '.xls': 'excel'}
+_TIME_SLOT_COLUMNS = ['day', 'period', 'start_time', 'end_time']
+_TIME_SLOT_DTYPES = {'day': 'category', 'period': np.int16, 'start_time': str, 'end_time': str}
+
 class DataLoader:
     """데이터 로딩을 담당하는 클래스"""
     def __init__(self, data_dir='data'):
@@ -20,54 +48,95 @@ class DataLoader:
             data_dir (str): 데이터 파일이 저장된 디렉토리 경로
         """
         self.data_dir = data_dir
-        self.subjects = self.load_subjects()
-        self.teachers = self.load_teachers()
-        self.locations = self.load_locations()
-        self.time_slots = self.load_time_slots()
-        self.teacher_assignments = self.load_teacher_assignments()
+
+    @cached_property
+    def subjects(self):
+        """과목 정보 (처음 접근할 때 로드)"""
+        return self.load_subjects()
+
+    @cached_property
+    def teachers(self):
+        """교사 정보 (처음 접근할 때 로드)"""
+        return self.load_teachers(self.subjects)
+
+    @cached_property
+    def locations(self):
+        """위치 정보 (처음 접근할 때 로드)"""
+        return self.load_locations()
+
+    @cached_property
+    def time_slots(self):
+        """시간 정보 (처음 접근할 때 로드)"""
+        return self.load_time_slots()
+
+    @cached_property
+    def teacher_assignments(self):
+        """교사 배정 정보 (처음 접근할 때 로드)"""
+        return self.load_teacher_assignments()
 
     def load_subjects(self) -> List[Subject]:
         """과목 정보 로드
         Returns:
             List[Subject]: 과목 객체 리스트
         """
-        df = pd.read_csv(f'{self.data_dir}/subjects.csv')
-        return [Subject(row['subject'], row['teachers'].split(','), row['required'] == 'true') for _, row in df.iterrows()]
+        df = pd.read_csv(f'{self.data_dir}/subjects.csv', usecols=_SUBJECT_COLUMNS,
+                         dtype=_SUBJECT_DTYPES, converters=_SUBJECT_CONVERTERS)
+        # 행마다 Series를 만드는 iterrows 대신 컬럼 배열을 묶어서 순회
+        # (교사 목록은 converter에서 이미 정리된 이름 리스트)
+        teachers = df['teachers'].tolist()
+        required = df['required'].tolist()
+        return [Subject(subject, names, req)
+                for subject, names, req in zip(df['subject'].tolist(), teachers, required)]
 
-    def load_teachers(self) -> List[Teacher]:
+    def load_teachers(self, subjects: Optional[List[Subject]] = None) -> List[Teacher]:
         """교사 정보 로드
+        Args:
+            subjects (List[Subject], optional): 이미 로드한 과목 목록 (없으면 self.subjects 사용)
         Returns:
             List[Teacher]: 교사 객체 리스트
         """
-        # 모든 과목의 teacher를 합쳐서 유니크하게 만듦
-        teachers = set()
-        for subj in self.load_subjects():
-            teachers.update(subj.teachers)
-        return [Teacher(name) for name in teachers if name]
+        # subjects.csv를 다시 읽지 않고 로드된 과목 정보에서 교사를 모음
+        if subjects is None:
+            subjects = self.subjects
+        # 모든 과목의 교사 목록을 explode로 한 번에 펼치고, 처음 나온 순서대로 중복 제거
+        names = pd.Series([subj.teachers for subj in subjects], dtype=object).explode().dropna()
+        names = names.astype(str).str.strip()
+        return [Teacher(name) for name in names[names != ''].unique()]
 
     def load_locations(self) -> List[Location]:
         """위치 정보 로드
         Returns:
             List[Location]: 위치 객체 리스트
         """
-        df = pd.read_csv(f'{self.data_dir}/locations.csv')
-        return [Location(row['building'], int(row['floor']), row['room_number'], float(row['x_coord']), float(row['y_coord'])) for _, row in df.iterrows()]
+        df = pd.read_csv(f'{self.data_dir}/locations.csv', usecols=_LOCATION_COLUMNS,
+                         dtype=_LOCATION_DTYPES, engine=_CSV_ENGINE)
+        # 숫자 컬럼은 읽을 때 타입이 정해지므로 tolist()만으로 파이썬 int/float가 됨
+        floors = df['floor'].tolist()
+        xs = df['x_coord'].tolist()
+        ys = df['y_coord'].tolist()
+        return [Location(building, floor, room, x, y)
+                for building, floor, room, x, y in zip(df['building'].tolist(), floors, df['room_number'].tolist(), xs, ys)]
 
     def load_time_slots(self) -> List[TimeSlot]:
         """시간 정보 로드
         Returns:
             List[TimeSlot]: 시간 객체 리스트
         """
-        df = pd.read_csv(f'{self.data_dir}/time_slots.csv')
-        return [TimeSlot(row['day'], int(row['period']), row['start_time'], row['end_time']) for _, row in df.iterrows()]
+        df = pd.read_csv(f'{self.data_dir}/time_slots.csv', usecols=_TIME_SLOT_COLUMNS,
+                         dtype=_TIME_SLOT_DTYPES, engine=_CSV_ENGINE)
+        periods = df['period'].tolist()
+        return [TimeSlot(day, period, start, end)
+                for day, period, start, end in zip(df['day'].tolist(), periods, df['start_time'].tolist(), df['end_time'].tolist())]
 
-    def load_teacher_assignments(self):
+    def load_teacher_assignments(self) -> RowView:
         """교사 배정 정보 로드
         Returns:
-            list: 교사 배정 정보 딕셔너리 리스트
+            RowView: 컬럼 배열로 보관하는 교사 배정 정보
+                (assignments['teacher'][i]로 조회, 행 dict는 순회할 때만 생성)
         """
-        df = pd.read_csv(f'{self.data_dir}/teacher_assignments.csv')
-        return df.to_dict('records')
+        df = pd.read_csv(f'{self.data_dir}/teacher_assignments.csv', engine=_CSV_ENGINE)
+        # 행마다 dict를 만드는 to_dict('records') 대신 컬럼 배열 그대로 전달
+        return RowView(df)
 
 class DataManager:
     """
@@ -77,16 +146,19 @@ class DataManager:
     전처리하며, 저장하는 기능을 제공합니다.
     """
     
-    def __init__(self, data_dir: str = 'data'):
+    def __init__(self, data_dir: str = 'data', ttl: float = 10.0):
         """
         DataManager 초기화
         
         Args:
             data_dir (str): 데이터 파일이 저장된 디렉토리 경로
+            ttl (float): 캐시된 데이터를 파일 확인 없이 바로 돌려줄 시간 (초)
         """
         self.data_dir = data_dir
+        self.ttl = ttl
         self.cache = {}  # 데이터 캐시
-        self.last_modified = {}  # 파일별 마지막 수정 시간
+        self.last_modified = {}  # 파일별 마지막 수정 시간 (ns)
+        self.checked_at = {}  # 파일별 마지막으로 수정 시간을 확인한 시각 (monotonic)
         
         # 데이터 디렉토리가 없으면 생성
         if not os.path.exists(data_dir):
@@ -109,38 +181,64 @@ class DataManager:
         try:
             file_path = os.path.join(self.data_dir, file_name)
             
-            # 파일이 존재하는지 확인
-            if not os.path.exists(file_path):
+            # TTL 안에 확인한 파일은 stat 없이 캐시를 그대로 사용
+            now = monotonic()
+            if file_path in self.cache and now - self.checked_at.get(file_path, float('-inf')) < self.ttl:
+                return self.cache[file_path]
+            
+            # 존재 여부와 수정 시간을 stat 한 번으로 확인
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 logger.error(f"파일을 찾을 수 없음: {file_path}")
                 return None
-                
-            # 파일 수정 시간 확인
-            current_mtime = os.path.getmtime(file_path)
-            if file_path in self.last_modified and current_mtime == self.last_modified[file_path]:
+            current_mtime = st.st_mtime_ns
+            if self.last_modified.get(file_path) == current_mtime:
+                # 바뀌지 않았으면 다시 읽지 않고 TTL만 갱신
+                self.checked_at[file_path] = now
                 logger.info("캐시된 데이터 사용")
                 return self.cache.get(file_path)
                 
+            # 전처리 결과 파일에 기록된 원본 상태(수정 시간 ns, 크기)가 같으면
+            # 파싱/전처리 없이 그대로 사용 (확장자만 다른 파일끼리 겹치지 않도록 전체 파일명에 붙임)
+            prep_path = file_path + '.prep.pkl'
+            source_stamp = (current_mtime, st.st_size)
+            try:
+                cached = pd.read_pickle(prep_path)
+                if cached.get('source') == source_stamp:
+                    data = cached['data']
+                    self.cache[file_path] = data
+                    self.last_modified[file_path] = current_mtime
+                    self.checked_at[file_path] = now
+                    logger.info(f"전처리된 데이터 로드 완료: {prep_path}")
+                    return data
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"전처리 캐시 파일 로드 실패, 원본을 다시 읽습니다: {str(e)}")
+                
             # 파일 형식 결정
             if file_type is None:
                 file_type = self._detect_file_type(file_name)
                 
             # 파일 형식에 따라 데이터 로드
-            if file_type == 'csv':
-                data = pd.read_csv(file_path)
-            elif file_type == 'json':
-                data = pd.read_json(file_path)
-            elif file_type == 'excel':
-                data = pd.read_excel(file_path)
-            else:
+            handler = _FILE_HANDLERS.get(file_type)
+            if handler is None:
                 logger.error(f"지원하지 않는 파일 형식: {file_type}")
                 return None
+            data = handler[0](file_path)
                 
             # 데이터 전처리
             data = self._preprocess_data(data)
             
-            # 캐시 업데이트
+            # 캐시 업데이트 (다음 실행을 위해 전처리 결과도 파일로 저장)
             self.cache[file_path] = data
             self.last_modified[file_path] = current_mtime
+            self.checked_at[file_path] = now
+            try:
+                pd.to_pickle({'source': source_stamp, 'data': data}, prep_path)
+            except Exception as e:
+                logger.warning(f"전처리 캐시 파일 저장 실패: {str(e)}")
             
             logger.info(f"데이터 로드 완료: {file_path}")
             return data
@@ -172,19 +270,16 @@ class DataManager:
                 file_type = self._detect_file_type(file_name)
                 
             # 파일 형식에 따라 데이터 저장
-            if file_type == 'csv':
-                data.to_csv(file_path, index=False)
-            elif file_type == 'json':
-                data.to_json(file_path, orient='records')
-            elif file_type == 'excel':
-                data.to_excel(file_path, index=False)
-            else:
+            handler = _FILE_HANDLERS.get(file_type)
+            if handler is None:
                 logger.error(f"지원하지 않는 파일 형식: {file_type}")
                 return False
+            handler[1](data, file_path)
                 
             # 캐시 업데이트
             self.cache[file_path] = data
-            self.last_modified[file_path] = os.path.getmtime(file_path)
+            self.last_modified[file_path] = os.stat(file_path).st_mtime_ns
+            self.checked_at[file_path] = monotonic()
             
             logger.info(f"데이터 저장 완료: {file_path}")
             return True
@@ -204,16 +299,10 @@ class DataManager:
             str: 감지된 파일 형식
         """
         extension = os.path.splitext(file_name)[1].lower()
-        
-        if extension == '.csv':
-            return 'csv'
-        elif extension == '.json':
-            return 'json'
-        elif extension in ['.xlsx', '.xls']:
-            return 'excel'
-        else:
+        file_type = _FILE_TYPES.get(extension)
+        if file_type is None:
             logger.warning(f"알 수 없는 파일 형식: {extension}")
-            return None
+        return file_type
             
     def _preprocess_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -254,17 +343,18 @@ class DataManager:
         Returns:
             pd.DataFrame: 결측치가 처리된 데이터
         """
-        # 숫자형 컬럼의 결측치를 평균값으로 대체
-        numeric_columns = data.select_dtypes(include=[np.number]).columns
-        for col in numeric_columns:
-            data[col] = data[col].fillna(data[col].mean())
-            
-        # 범주형 컬럼의 결측치를 최빈값으로 대체
-        categorical_columns = data.select_dtypes(include=['object']).columns
-        for col in categorical_columns:
-            data[col] = data[col].fillna(data[col].mode()[0])
-            
-        return data
+        # 숫자형 컬럼은 평균값, 범주형 컬럼은 최빈값으로 채울 값을 한 번에 계산
+        # (컬럼마다 대입하지 않고 fillna 한 번으로 처리)
+        fill = data.select_dtypes(include=[np.number]).mean().to_dict()
+        for col, values in data.select_dtypes(include=['object']).items():
+            counts = values.value_counts(sort=False)
+            if len(counts) == 0:
+                continue
+            # mode()처럼 전체 정렬하지 않고 최대 빈도 값만 고름
+            # (동률이면 값끼리 비교할 수 없는 타입이 섞여 있을 수 있으므로 mode()에 맡김)
+            is_max = counts.to_numpy() == counts.max()
+            fill[col] = counts.idxmax() if is_max.sum() == 1 else values.mode().iloc[0]
+        return data.fillna(fill)
         
     def _convert_data_types(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -280,15 +370,21 @@ class DataManager:
         date_columns = [col for col in data.columns if 'date' in col.lower() or 'time' in col.lower()]
         for col in date_columns:
             try:
-                data[col] = pd.to_datetime(data[col])
+                # ISO 8601 형식은 셀마다 형식을 추론하지 않고 C 파서로 한 번에 변환
+                data[col] = pd.to_datetime(data[col], format='ISO8601')
+            except (ValueError, TypeError):
+                try:
+                    data[col] = pd.to_datetime(data[col])
+                except:
+                    pass
             except:
                 pass
                 
-        # 숫자형 컬럼 변환
+        # 숫자형 컬럼 변환 (정수는 값 범위에 맞는 가장 작은 타입으로)
         numeric_columns = [col for col in data.columns if 'id' in col.lower() or 'count' in col.lower()]
         for col in numeric_columns:
             try:
-                data[col] = pd.to_numeric(data[col])
+                data[col] = pd.to_numeric(data[col], downcast='integer')
             except:
                 pass
                 
@@ -325,26 +421,28 @@ class DataManager:
             pd.DataFrame: 이상치가 처리된 데이터
         """
         # 숫자형 컬럼에 대해서만 이상치 처리
-        numeric_columns = data.select_dtypes(include=[np.number]).columns
+        numeric = data.select_dtypes(include=[np.number])
+        if len(numeric.columns) == 0:
+            return data
         
-        for col in numeric_columns:
-            # IQR 방식으로 이상치 탐지
-            Q1 = data[col].quantile(0.25)
-            Q3 = data[col].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            # 이상치를 경계값으로 대체
-            data[col] = data[col].clip(lower=lower_bound, upper=upper_bound)
-            
+        # IQR 방식으로 이상치 탐지 (모든 컬럼의 사분위수를 한 번에 계산)
+        quartiles = numeric.quantile([0.25, 0.75])
+        Q1 = quartiles.loc[0.25]
+        Q3 = quartiles.loc[0.75]
+        IQR = Q3 - Q1
+        
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+        
+        # 이상치를 경계값으로 대체 (컬럼별 경계를 맞춰 한 번에 clip)
+        data[numeric.columns] = numeric.clip(lower=lower_bound, upper=upper_bound, axis=1)
         return data
         
     def clear_cache(self):
         """데이터 캐시 초기화"""
         self.cache.clear()
         self.last_modified.clear()
+        self.checked_at.clear()
         logger.info("데이터 캐시가 초기화되었습니다.")
         
     def get_data_info(self, file_name: str) -> Dict[str, Any]:
@@ -360,15 +458,18 @@ class DataManager:
         try:
             file_path = os.path.join(self.data_dir, file_name)
             
-            if not os.path.exists(file_path):
+            # 존재 여부, 크기, 수정 시간을 stat 한 번으로 확인
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 logger.error(f"파일을 찾을 수 없음: {file_path}")
                 return {}
                 
             # 파일 정보 수집
             file_info = {
                 'file_name': file_name,
-                'file_size': os.path.getsize(file_path),
-                'last_modified': datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat(),
+                'file_size': st.st_size,
+                'last_modified': datetime.fromtimestamp(st.st_mtime).isoformat(),
                 'file_type': self._detect_file_type(file_name)
             }
             
@@ -8,6 +8,7 @@ from route_optimizer import RouteOptimizer  # 경로 최적화 클래스
 import os
 import sys
 import json
+import asyncio
 import time
 import logging
 import numpy as np
@@ -197,9 +198,8 @@ class DeliveryOptimizationSystem:
             current_time = datetime.now()
             self.last_optimization_time = current_time
             
-            # 데이터 로드
-            delivery_data = self.data_loader.load_delivery_data()
-            vehicle_data = self.data_loader.load_vehicle_data()
+            # 데이터 로드 (배달/차량 데이터를 동시에 로드)
+            delivery_data, vehicle_data = asyncio.run(self.data_loader.load_all())
             
             # 데이터 유효성 검사
             if not self.validate_data(delivery_data, vehicle_data):
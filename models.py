@@ -1,6 +1,6 @@
 # 필요한 라이브러리 임포트
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, NamedTuple
 import numpy as np
 from datetime import datetime, timedelta
 import logging
@@ -39,6 +39,42 @@ class Location:
     address: str
     type: str
 
+class LocationView(NamedTuple):
+    """LocationsSoA의 한 행을 나타내는 가벼운 교실 위치 객체"""
+    building: str  # 건물
+    floor: int  # 층
+    room_number: str  # 교실 번호
+    x_coord: float  # x 좌표
+    y_coord: float  # y 좌표
+
+@dataclass
+class LocationsSoA:
+    """
+    교실 위치 정보를 컬럼별 NumPy 배열로 저장하는 클래스 (SoA)
+    
+    인덱싱/순회 시에는 LocationView를 돌려주므로 리스트처럼 사용할 수 있습니다.
+    """
+    xs: np.ndarray  # x 좌표 (float32)
+    ys: np.ndarray  # y 좌표 (float32)
+    floors: np.ndarray  # 층 (int32)
+    buildings: np.ndarray  # 건물
+    rooms: np.ndarray  # 교실 번호
+
+    def __len__(self):
+        return len(self.rooms)
+
+    def __getitem__(self, i):
+        # 슬라이스는 같은 배열의 뷰로 새 SoA 반환
+        if isinstance(i, slice):
+            return LocationsSoA(self.xs[i], self.ys[i], self.floors[i], self.buildings[i], self.rooms[i])
+        return LocationView(self.buildings[i], int(self.floors[i]), self.rooms[i],
+                            float(self.xs[i]), float(self.ys[i]))
+
+    def __iter__(self):
+        for b, f, r, x, y in zip(self.buildings, self.floors.tolist(), self.rooms,
+                                 self.xs.tolist(), self.ys.tolist()):
+            yield LocationView(b, f, r, x, y)
+
 @dataclass
 class TimeSlot:
     """시간 정보를 담는 데이터 클래스"""
@@ -2,7 +2,10 @@ from typing import List, Dict, Union
 import pandas as pd
 import networkx as nx
 import math
+import numpy as np
+import threading
 from models import Location
+from graph_util import clear_path_cache
 
 class RouteOptimizer:
     """경로 최적화를 담당하는 클래스"""
@@ -13,6 +16,10 @@ class RouteOptimizer:
         """
         self.locations = loader.load_locations()
         self.graph = self.create_graph(self.locations)
+        # shortest_path 결과 캐시: (시작, 도착) -> 상세 경로 (그래프가 바뀌면 초기화)
+        self._path_cache: Dict[tuple, tuple] = {}
+        # 백그라운드 precompute_targets와 add_location이 그래프/캐시를 동시에 건드리지 않도록 보호
+        self._graph_lock = threading.RLock()
 
     def create_graph(self, locations: Union[pd.DataFrame, List[Dict]]) -> nx.Graph:
         """위치 정보를 기반으로 그래프 생성
@@ -80,6 +87,94 @@ class RouteOptimizer:
         
         return G
     
+    def add_location(self, location: Dict) -> None:
+        """위치 하나를 추가하고 그래프에는 새 노드와 그 엣지만 추가
+        Args:
+            location (dict): building, floor, room_number, x_coord, y_coord (elevator는 선택)
+        """
+        with self._graph_lock:
+            self._add_location(location)
+
+    def _add_location(self, location: Dict) -> None:
+        """add_location 본문 (_graph_lock을 잡은 상태에서 호출)"""
+        location = {**location, 'elevator': location.get('elevator', 0)}
+        records = self._location_records()
+        records.append(location)
+        self.locations = records
+        self._path_cache.clear()
+        
+        G = self.graph
+        clear_path_cache(G)
+        node = location['room_number']
+        building, floor = location['building'], location['floor']
+        x, y = location['x_coord'], location['y_coord']
+        representatives = self._building_representatives()
+        
+        # 이미 있는 교실을 덮어쓰거나 건물의 1층 대표 노드가 바뀌면 전체를 다시 생성
+        if node in G or (floor == 1 and building in representatives):
+            self.graph = self.create_graph(records)
+            return
+        
+        G.add_node(node, pos=(x, y), building=building, floor=floor, elevator=location['elevator'])
+        
+        # create_graph와 같은 순서로 엣지 추가 (나중에 추가한 가중치가 우선)
+        # 같은 건물, 같은 층 노드와 연결 (거리는 한 번에 계산)
+        same_floor = [(n, data['pos']) for n, data in G.nodes(data=True)
+                      if n != node and data['building'] == building and data['floor'] == floor]
+        if same_floor:
+            names, positions = zip(*same_floor)
+            positions = np.asarray(positions, dtype=float)
+            dists = np.hypot(positions[:, 0] - x, positions[:, 1] - y)
+            G.add_weighted_edges_from((n, node, d) for n, d in zip(names, dists.tolist()))
+        
+        # 엘리베이터 노드끼리 연결
+        if location['elevator'] == 1:
+            for n, data in G.nodes(data=True):
+                if n != node and data.get('elevator', 0) == 1 and data['building'] == building:
+                    G.add_edge(n, node, weight=abs(data['floor'] - floor) * 10)
+        
+        rep_node = representatives.get(building)
+        if rep_node:
+            # 건물의 1층 대표 노드와 연결
+            G.add_edge(node, rep_node, weight=abs(floor - G.nodes[rep_node]['floor']) * 10)
+        elif floor == 1:
+            # 새 노드가 건물의 대표 노드: 건물 내 노드 및 다른 대표 노드와 연결
+            for n, data in G.nodes(data=True):
+                if n != node and data['building'] == building:
+                    G.add_edge(n, node, weight=abs(data['floor'] - floor) * 10)
+            for other in representatives.values():
+                G.add_edge(other, node, weight=100)
+
+    def _location_records(self) -> List[Dict]:
+        """self.locations를 dict 리스트로 변환"""
+        if isinstance(self.locations, pd.DataFrame):
+            return self.locations.to_dict('records')
+        return [loc if isinstance(loc, dict) else loc._asdict() for loc in self.locations]
+
+    def _building_representatives(self) -> Dict:
+        """건물별 1층 대표 노드 (create_graph와 같은 규칙)"""
+        representatives = {}
+        for node, data in self.graph.nodes(data=True):
+            if data['floor'] == 1:
+                representatives[data['building']] = node
+        return representatives
+    
+    def precompute_targets(self, targets: List[str]) -> None:
+        """모든 위치에서 주어진 목적지까지의 경로를 미리 계산해 캐시에 저장
+        Args:
+            targets (List[str]): 자주 조회하는 목적지 목록
+        """
+        for end in targets:
+            # 목적지 하나씩 잠금을 잡아 add_location이 오래 기다리지 않게 하고,
+            # 그래프가 바뀌는 도중에 순회하거나 바뀌기 전 경로를 캐시에 쓰지 않도록 함
+            with self._graph_lock:
+                if end not in self.graph:
+                    continue
+                # 무방향 그래프이므로 목적지에서 한 번만 Dijkstra를 실행하고 경로를 뒤집어 사용
+                paths = nx.single_source_dijkstra_path(self.graph, end, weight='weight')
+                for start, path in paths.items():
+                    self._path_cache[(start, end)] = tuple(self._describe_path(path[::-1]))
+
     def shortest_path(self, start: str, end: str) -> List[str]:
         """두 위치 간의 최단 경로 계산
         Args:
@@ -88,42 +183,57 @@ class RouteOptimizer:
         Returns:
             List[str]: 상세 경로 정보 리스트
         """
+        cached = self._path_cache.get((start, end))
+        if cached is not None:
+            return list(cached)
         try:
-            # 시작점과 끝점이 그래프에 존재하는지 확인
-            if start not in self.graph or end not in self.graph:
-                raise ValueError(f"시작점({start}) 또는 끝점({end})이 그래프에 존재하지 않습니다.")
-            
-            # 최단 경로 계산
-            path = nx.shortest_path(self.graph, start, end, weight='weight')
-            
-            # 경로 상세 정보 생성
-            detailed_path = []
-            for i in range(len(path)-1):
-                current = path[i]
-                next_node = path[i+1]
+            with self._graph_lock:
+                # 시작점과 끝점이 그래프에 존재하는지 확인
+                if start not in self.graph or end not in self.graph:
+                    raise ValueError(f"시작점({start}) 또는 끝점({end})이 그래프에 존재하지 않습니다.")
                 
-                current_data = self.graph.nodes[current]
-                next_data = self.graph.nodes[next_node]
+                # 최단 경로 계산
+                path = nx.shortest_path(self.graph, start, end, weight='weight')
                 
-                # 건물이 다른 경우
-                if current_data['building'] != next_data['building']:
-                    detailed_path.append(f"{current} → {next_node} (건물 이동)")
-                # 층이 다른 경우
-                elif current_data['floor'] != next_data['floor']:
-                    if '엘리베이터' in current and '엘리베이터' in next_node:
-                        detailed_path.append(f"{current} → {next_node} (엘리베이터 사용)")
-                    else:
-                        detailed_path.append(f"{current} → {next_node} (계단 사용)")
-                # 같은 건물, 같은 층
-                else:
-                    detailed_path.append(f"{current} → {next_node}")
-            
+                # 경로 상세 정보 생성
+                detailed_path = self._describe_path(path)
+                
+                self._path_cache[(start, end)] = tuple(detailed_path)
             return detailed_path
         except nx.NetworkXNoPath:
             raise ValueError(f"{start}에서 {end}까지의 경로를 찾을 수 없습니다.")
         except Exception as e:
             raise ValueError(f"경로 계산 중 오류가 발생했습니다: {str(e)}")
 
+    def _describe_path(self, path: List[str]) -> List[str]:
+        """노드 경로를 구간별 상세 안내 문자열로 변환
+        Args:
+            path (List[str]): 노드 경로
+        Returns:
+            List[str]: 상세 경로 정보 리스트
+        """
+        detailed_path = []
+        for i in range(len(path)-1):
+            current = path[i]
+            next_node = path[i+1]
+            
+            current_data = self.graph.nodes[current]
+            next_data = self.graph.nodes[next_node]
+            
+            # 건물이 다른 경우
+            if current_data['building'] != next_data['building']:
+                detailed_path.append(f"{current} → {next_node} (건물 이동)")
+            # 층이 다른 경우
+            elif current_data['floor'] != next_data['floor']:
+                if '엘리베이터' in current and '엘리베이터' in next_node:
+                    detailed_path.append(f"{current} → {next_node} (엘리베이터 사용)")
+                else:
+                    detailed_path.append(f"{current} → {next_node} (계단 사용)")
+            # 같은 건물, 같은 층
+            else:
+                detailed_path.append(f"{current} → {next_node}")
+        return detailed_path
+
     def calculate_distance(self, loc1: Location, loc2: Location) -> float:
         """두 위치 간의 유클리드 거리 계산
         Args:
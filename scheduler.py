@@ -1,8 +1,9 @@
-from graph_util import build_graph, shortest_path
+from graph_util import build_graph, shortest_path_length
 import random
 from loader import DataLoader
 from models import Teacher, Location
 import numpy as np
+import networkx as nx
 from typing import List, Dict, Tuple
 from datetime import datetime, timedelta
 import logging
@@ -19,22 +20,26 @@ class Scheduler:
             loader (DataLoader): 데이터 로더 객체
         """
         self.loader = loader
-        self.school_data = loader.load_school_data()
-        self.locations = loader.load_locations()
+        self.reload()
+
+    def reload(self):
+        """학교/위치 데이터를 파일에서 다시 읽고 그래프와 교사 정보를 새로 만듦"""
+        self.school_data = self.loader.load_school_data()
+        self.locations = self.loader.load_locations()
         self.graph = build_graph(self.locations)
         self.rooms = [loc.room_number for loc in self.locations]
-        self.teachers = loader.load_teachers()
+        self.teachers = self.loader.load_teachers()
         self.teacher_home_rooms = {t.name: t.home_room for t in self.teachers}
 
     def get_subjects(self):
         """전체 과목 목록 반환"""
-        return list(set(row['과목'] for row in self.school_data))
+        return list(set(self.school_data['과목']))
 
     def get_classes(self):
         """전체 반 목록 반환"""
         all_classes = set()
-        for row in self.school_data:
-            for c in str(row['담당 반']).split(','):
+        for classes in self.school_data['담당 반']:
+            for c in str(classes).split(','):
                 all_classes.add(c.strip())
         return sorted(all_classes)
 
@@ -58,12 +63,26 @@ class Scheduler:
                     prev_room = self.teacher_home_rooms[teacher]
                 
                 if prev_room:
-                    path = shortest_path(self.graph, prev_room, room)
-                    dist = sum(self.graph[u][v]['weight'] for u, v in zip(path, path[1:]))
-                    total += dist
+                    total += shortest_path_length(self.graph, prev_room, room)
                 prev_room = room
         return total
 
+    def _room_distance_matrix(self):
+        """모든 교실 쌍의 최단 거리 행렬 계산
+        Returns:
+            tuple: (교실 -> 인덱스 dict, 거리 행렬)
+                거리 행렬의 마지막 행/열은 그래프에 없는 교실용이며,
+                그래프에 없거나 경로가 없는 쌍의 거리는 0 (이동 거리에서 제외)
+        """
+        rooms = list(self.graph.nodes)
+        room_index = {room: i for i, room in enumerate(rooms)}
+        n = len(rooms)
+        distances = np.zeros((n + 1, n + 1))
+        if n:
+            all_pairs = nx.floyd_warshall_numpy(self.graph, nodelist=rooms, weight='weight')
+            distances[:n, :n] = np.where(np.isinf(all_pairs), 0.0, all_pairs)
+        return room_index, distances
+
     def generate(self, trials=1000):
         """시간표 생성
         Args:
@@ -80,6 +99,20 @@ class Scheduler:
             '금요일': 5
         }
         class_list = self.get_classes()
+        
+        # 반별 담당 과목 행을 컬럼 배열에서 한 번만 추출
+        cols = self.school_data
+        weekly_hours = cols['주간시수'] if '주간시수' in cols else [1] * len(cols['과목'])
+        rows = list(zip(cols['과목'], cols['선생님'], cols['담당 교실'], cols['담당 반'], weekly_hours))
+        class_rows_map = {
+            class_num: [row for row in rows if class_num in str(row[3]).split(',')]
+            for class_num in class_list
+        }
+        
+        # 교실 간 최단 거리는 시도마다 같으므로 한 번만 계산
+        room_index, room_distances = self._room_distance_matrix()
+        unknown_room = len(room_index)
+        
         best_timetables = None
         best_total_move = float('inf')
         for _ in range(trials):
@@ -90,17 +123,16 @@ class Scheduler:
             
             # 각 반의 과목 정보 설정
             for class_num in class_list:
-                class_rows = [row for row in self.school_data if class_num in str(row['담당 반']).split(',')]
                 subject_slots = []
                 subject_count = {}
-                for row in class_rows:
-                    count = int(row.get('주간시수', 1))
-                    subject_count[row['과목']] = count
+                for subject, teacher, room, _, hours in class_rows_map[class_num]:
+                    count = int(hours)
+                    subject_count[subject] = count
                     for _ in range(count):
                         subject_slots.append({
-                            '과목': row['과목'],
-                            '선생님': row['선생님'],
-                            '교실': row['담당 교실']
+                            '과목': subject,
+                            '선생님': teacher,
+                            '교실': room
                         })
                 random.shuffle(subject_slots)
                 class_subject_slots[class_num] = subject_slots
@@ -126,22 +158,16 @@ class Scheduler:
                             used_teachers.add(slot['선생님'])
             
             # 이동 거리 계산 (반별 이동 거리의 합)
-            total_move = 0
+            # 교실 순서를 인덱스 쌍으로 모은 뒤 거리 행렬에서 한 번에 합산
+            from_rooms = []
+            to_rooms = []
             for class_num in class_list:
-                prev_room = None
-                for day in days:
-                    for period in range(periods_per_day[day]):
-                        slot = timetables[class_num][day][period]
-                        if slot and slot['교실']:
-                            room = slot['교실']
-                            if prev_room:
-                                try:
-                                    path = shortest_path(self.graph, prev_room, room)
-                                    dist = sum(self.graph[u][v]['weight'] for u, v in zip(path, path[1:]))
-                                    total_move += dist
-                                except Exception:
-                                    pass
-                            prev_room = room
+                rooms = [room_index.get(slot['교실'], unknown_room)
+                         for day in days for slot in timetables[class_num][day]
+                         if slot and slot['교실']]
+                from_rooms.extend(rooms[:-1])
+                to_rooms.extend(rooms[1:])
+            total_move = float(room_distances[from_rooms, to_rooms].sum())
             
             # 최적의 시간표 업데이트
             if total_move < best_total_move:
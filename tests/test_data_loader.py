@@ -0,0 +1,153 @@
+# data_loader.DataLoader CSV 캐시 테스트
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_loader import DataLoader, parse_cell_value
+
+
+class AppendCsvTest(unittest.TestCase):
+    """DataLoader.append_csv 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        shutil.copy(os.path.join(ROOT, 'data', 'locations.csv'), self.tmp.name)
+        self.loader = DataLoader(self.tmp.name)
+        self.loader.load_csv('locations')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fresh_load(self):
+        """캐시/피클 파일 없이 CSV를 새로 읽은 결과"""
+        sidecar = os.path.join(self.tmp.name, 'locations.pkl')
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+        return DataLoader(self.tmp.name).load_csv('locations')
+
+    def test_dtypes_kept_after_append(self):
+        """행을 추가한 뒤에도 캐시된 DataFrame의 컬럼 타입이 새로 읽은 것과 같음"""
+        before = self.loader.load_csv('locations').dtypes
+        self.loader.append_csv('locations', {'room_number': '새교실', 'building': '예지관',
+                                             'floor': 2, 'x_coord': 1.5, 'y_coord': -2,
+                                             'elevator': 0})
+        appended = self.loader.load_csv('locations')
+        self.assertTrue(appended.dtypes.equals(before))
+        fresh = self._fresh_load()
+        self.assertTrue(appended.dtypes.equals(fresh.dtypes))
+        self.assertTrue(appended.equals(fresh))
+
+    def test_missing_value_matches_fresh_load(self):
+        """빈 값이 있는 행을 추가해도 새로 읽은 것과 같은 타입/값"""
+        self.loader.append_csv('locations', {'room_number': '새교실', 'building': '예지관',
+                                             'floor': 2, 'x_coord': 1.5, 'y_coord': -2})
+        appended = self.loader.load_csv('locations')
+        fresh = self._fresh_load()
+        self.assertTrue(appended.dtypes.equals(fresh.dtypes))
+        self.assertTrue(appended.equals(fresh))
+
+    def test_sidecar_written_with_csv_dtypes(self):
+        """행 추가 후 저장된 피클 파일을 다음 로더가 읽어도 새로 읽은 것과 같은 타입"""
+        self.loader.append_csv('locations', {'room_number': '새교실', 'building': '예지관',
+                                             'floor': 2, 'x_coord': 1.5, 'y_coord': -2})
+        from_sidecar = DataLoader(self.tmp.name).load_csv('locations')
+        fresh = self._fresh_load()
+        self.assertTrue(from_sidecar.dtypes.equals(fresh.dtypes))
+        self.assertTrue(from_sidecar.equals(fresh))
+
+    def test_unparseable_row_not_written(self):
+        """지정한 타입으로 읽을 수 없는 행은 ValueError를 내고 파일과 캐시를 그대로 둠"""
+        csv_path = os.path.join(self.tmp.name, 'locations.csv')
+        with open(csv_path, 'rb') as f:
+            before = f.read()
+        cached = self.loader.load_csv('locations')
+        with self.assertRaises(ValueError):
+            self.loader.append_csv('locations', {'room_number': '새교실', 'building': '예지관',
+                                                 'floor': '', 'x_coord': 1.5, 'y_coord': -2})
+        with open(csv_path, 'rb') as f:
+            self.assertEqual(f.read(), before)
+        self.assertIs(self.loader.load_csv('locations'), cached)
+        self.assertEqual(len(self._fresh_load()), len(cached))
+
+
+class CsvSidecarTest(unittest.TestCase):
+    """DataLoader.load_csv 피클 파일 캐시 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'locations.csv')
+        shutil.copy(os.path.join(ROOT, 'data', 'locations.csv'), self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_older_csv_is_not_served_from_sidecar(self):
+        """수정 시간이 더 오래된 CSV로 되돌려도 피클이 아닌 CSV 내용을 읽음"""
+        DataLoader(self.tmp.name).load_csv('locations')
+        st = os.stat(self.path)
+        pd.read_csv(self.path).head(3).to_csv(self.path, index=False)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+        self.assertEqual(len(DataLoader(self.tmp.name).load_csv('locations')), 3)
+
+    def test_unchanged_csv_uses_sidecar(self):
+        """CSV가 그대로면 피클 파일 내용을 사용"""
+        first = DataLoader(self.tmp.name).load_csv('locations')
+        second = DataLoader(self.tmp.name).load_csv('locations')
+        self.assertTrue(first.equals(second))
+        self.assertTrue(first.dtypes.equals(second.dtypes))
+
+
+class LoadDeliveryDataIterTest(unittest.TestCase):
+    """DataLoader.load_delivery_data_iter 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_time_window_column(self):
+        """time_window 컬럼이 없으면 읽기 전에 오류를 기록하고 아무것도 반환하지 않음"""
+        with open(os.path.join(self.tmp.name, 'delivery_data.csv'), 'w', encoding='utf-8') as f:
+            f.write('id,pickup_location,delivery_location\n1,A,B\n')
+        with self.assertLogs('data_loader', level='ERROR') as logs:
+            chunks = list(DataLoader(self.tmp.name).load_delivery_data_iter())
+        self.assertEqual(chunks, [])
+        self.assertIn('time_window', logs.output[0])
+
+
+class ParseCellValueTest(unittest.TestCase):
+    """parse_cell_value 테스트 (데이터 관리 표에서 숫자 셀 편집)"""
+
+    def test_edit_numeric_cells(self):
+        """문자열로 입력한 값을 int32/float32 컬럼에 타입을 유지한 채 대입"""
+        df = pd.DataFrame({'floor': np.array([1, 2], dtype=np.int32),
+                           'x_coord': np.array([0.5, 1.5], dtype=np.float32)})
+        df.iat[0, 0] = parse_cell_value('3', df.dtypes.iloc[0])
+        df.iat[1, 1] = parse_cell_value(' -2.5 ', df.dtypes.iloc[1])
+        self.assertEqual(df['floor'].tolist(), [3, 2])
+        self.assertEqual(df['x_coord'].tolist(), [0.5, -2.5])
+        self.assertEqual(df['floor'].dtype, np.int32)
+        self.assertEqual(df['x_coord'].dtype, np.float32)
+
+    def test_invalid_numeric_value(self):
+        """숫자 컬럼에 변환할 수 없는 값이면 ValueError"""
+        for value, dtype in [('abc', np.float32), ('1.5', np.int32), ('', np.int32)]:
+            with self.assertRaises(ValueError):
+                parse_cell_value(value, np.dtype(dtype))
+
+    def test_text_column_unchanged(self):
+        """문자열 컬럼은 입력 값을 그대로 사용"""
+        self.assertEqual(parse_cell_value('3층', pd.StringDtype()), '3층')
+
+
+if __name__ == '__main__':
+    unittest.main()
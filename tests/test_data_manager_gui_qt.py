@@ -0,0 +1,46 @@
+# data_manager_gui_qt.PandasModel 편집 테스트 (PyQt5가 있을 때만 실행)
+import os
+import sys
+import unittest
+from importlib.util import find_spec
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@unittest.skipUnless(find_spec('PyQt5'), 'PyQt5가 설치되어 있지 않음')
+class PandasModelEditTest(unittest.TestCase):
+    """PandasModel.setData 테스트"""
+
+    def setUp(self):
+        from PyQt5.QtCore import Qt
+        from data_manager_gui_qt import PandasModel
+        self.edit_role = Qt.EditRole
+        self.df = pd.DataFrame({'room_number': ['101', '102'],
+                                'floor': np.array([1, 2], dtype=np.int32),
+                                'x_coord': np.array([0.5, 1.5], dtype=np.float32)})
+        self.model = PandasModel(self.df)
+        self.errors = []
+        self.model.edit_failed.connect(self.errors.append)
+
+    def test_edit_numeric_cell(self):
+        """숫자 셀에 문자열을 입력하면 컬럼 타입으로 변환해 반영"""
+        self.assertTrue(self.model.setData(self.model.index(0, 1), '3', self.edit_role))
+        self.assertTrue(self.model.setData(self.model.index(1, 2), '-2.5', self.edit_role))
+        self.assertEqual(self.df['floor'].tolist(), [3, 2])
+        self.assertEqual(self.df['x_coord'].tolist(), [0.5, -2.5])
+        self.assertEqual(self.df['floor'].dtype, np.int32)
+        self.assertEqual(self.model.data(self.model.index(0, 1)), '3')
+        self.assertEqual(self.errors, [])
+
+    def test_invalid_numeric_cell_reports_error(self):
+        """변환할 수 없는 값은 반영하지 않고 오류를 알림"""
+        self.assertFalse(self.model.setData(self.model.index(0, 1), 'abc', self.edit_role))
+        self.assertEqual(self.df['floor'].tolist(), [1, 2])
+        self.assertEqual(len(self.errors), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# loader.DataManager 전처리 테스트
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loader import DataLoader, DataManager
+
+
+class HandleMissingValuesTest(unittest.TestCase):
+    """DataManager._handle_missing_values 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = DataManager(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_mixed_type_tie_uses_mode(self):
+        """서로 비교할 수 없는 값이 동률이어도 mode()와 같은 값으로 채움"""
+        data = pd.DataFrame({'c': pd.Series(['x', 1, None], dtype=object)})
+        result = self.manager._handle_missing_values(data)
+        self.assertEqual(result['c'].tolist(), ['x', 1, 1])
+
+    def test_single_most_frequent_value(self):
+        """최빈값이 하나면 그 값으로 채움"""
+        data = pd.DataFrame({'c': pd.Series(['b', 'a', 'b', None], dtype=object)})
+        result = self.manager._handle_missing_values(data)
+        self.assertEqual(result['c'].tolist(), ['b', 'a', 'b', 'b'])
+
+
+class LoadTeachersTest(unittest.TestCase):
+    """DataLoader.load_subjects / load_teachers 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmp.name, 'subjects.csv'), 'w', encoding='utf-8') as f:
+            f.write('subject,teachers,required\n수학,"김, 이",true\n체육,,false\n국어,김,true\n')
+        self.loader = DataLoader(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_blank_teachers_cell(self):
+        """교사 칸이 비어 있는 과목은 빈 목록으로 읽고 교사 목록에서 제외"""
+        self.assertEqual(self.loader.subjects[1].teachers, [])
+        self.assertEqual([t.name for t in self.loader.teachers], ['김', '이'])
+
+    def test_subject_teacher_names_stripped(self):
+        """과목의 교사 이름도 Teacher 이름과 같이 앞뒤 공백을 제거"""
+        self.assertEqual(self.loader.subjects[0].teachers, ['김', '이'])
+        teacher_names = {t.name for t in self.loader.teachers}
+        for subject in self.loader.subjects:
+            self.assertTrue(set(subject.teachers) <= teacher_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,32 +1,47 @@
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import networkx as nx
 import os
 import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional
 import logging
+from functools import lru_cache
+from graph_util import shortest_path_length
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-def setup_korean_font():
-    """한글 폰트 설정
+@lru_cache(maxsize=1)
+def load_korean_font():
+    """한글 폰트 속성 로드 (plt.rcParams 등 전역 설정은 바꾸지 않음)
     Returns:
-        FontProperties: 설정된 폰트 속성
+        FontProperties: 한글 폰트 속성
     Raises:
         RuntimeError: 폰트 파일이 없는 경우
     """
     font_path = os.path.join(os.path.dirname(__file__), 'NanumSquareNeo-cBd.ttf')
     if os.path.exists(font_path):
         font_prop = fm.FontProperties(fname=font_path)
-        plt.rcParams['font.family'] = font_prop.get_name()
-        plt.rcParams['axes.unicode_minus'] = False
         print(f"폰트 로드 성공: {font_path}")
         return font_prop
     else:
         raise RuntimeError("NanumSquareNeo-cBd.ttf 폰트 파일이 visualizer.py와 같은 폴더에 있어야 합니다.")
 
+def setup_korean_font():
+    """한글 폰트 설정 (plt.rcParams를 바꾸므로 메인 스레드에서만 호출)
+    Returns:
+        FontProperties: 설정된 폰트 속성
+    Raises:
+        RuntimeError: 폰트 파일이 없는 경우
+    """
+    font_prop = load_korean_font()
+    plt.rcParams['font.family'] = font_prop.get_name()
+    plt.rcParams['axes.unicode_minus'] = False
+    return font_prop
+
 def calc_daily_moves(timetable, graph):
     """일별 이동 거리 계산
     Args:
@@ -43,9 +58,7 @@ def calc_daily_moves(timetable, graph):
         for entry in timetable[day]:
             if entry and prev_room:
                 try:
-                    path = nx.shortest_path(graph, prev_room, entry['교실'], weight='weight')
-                    dist = sum(graph[u][v]['weight'] for u, v in zip(path, path[1:]))
-                    move += dist
+                    move += shortest_path_length(graph, prev_room, entry['교실'])
                 except Exception:
                     pass
             if entry:
@@ -53,15 +66,21 @@ def calc_daily_moves(timetable, graph):
         daily_moves.append(move)
     return daily_moves
 
-def plot_timetable(timetable, class_name="", graph=None, save_path=None):
+def plot_timetable(timetable, class_name="", graph=None, save_path=None, show=True, fontprop=None):
     """시간표 시각화
     Args:
         timetable (dict): 시간표 데이터
         class_name (str): 반 이름
         graph (nx.Graph, optional): 그래프 객체
         save_path (str, optional): 저장할 파일 경로
+        show (bool): 창으로 표시할지 여부 (False면 pyplot/GUI 백엔드 없이 Agg로 파일만 저장)
+        fontprop (FontProperties, optional): 사용할 한글 폰트 (작업 스레드에서 호출할 때는
+            전역 설정을 바꾸지 않도록 메인 스레드에서 load_korean_font로 받아 전달)
+    Returns:
+        str: 저장된 파일 경로 (저장하지 않으면 None)
     """
-    fontprop = setup_korean_font()
+    if fontprop is None:
+        fontprop = setup_korean_font() if show else load_korean_font()
     days = ['월요일', '화요일', '수요일', '목요일', '금요일']
     periods_per_day = {
         '월요일': 7, '화요일': 7, '수요일': 4, '목요일': 7, '금요일': 5
@@ -80,7 +99,14 @@ def plot_timetable(timetable, class_name="", graph=None, save_path=None):
             else:
                 row.append("")
         table_data.append(row)
-    fig, ax = plt.subplots(figsize=(12, 7))
+    if show:
+        # 창으로 띄울 때만 pyplot Figure 사용
+        fig, ax = plt.subplots(figsize=(12, 7))
+    else:
+        # 파일 저장만 할 때는 GUI 캔버스를 만들지 않는 독립 Figure + Agg 캔버스 사용
+        fig = Figure(figsize=(12, 7))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
     ax.axis('off')
     ax.axis('tight')
     table = ax.table(
@@ -118,13 +144,15 @@ def plot_timetable(timetable, class_name="", graph=None, save_path=None):
             cell.get_text().set_fontweight('bold')
             if fontprop:
                 cell.get_text().set_fontproperties(fontprop)
-    plt.title(f"{class_name}반 시간표", fontproperties=fontprop, fontsize=title_fontsize, fontweight='bold', pad=20)
-    plt.tight_layout()
+    ax.set_title(f"{class_name}반 시간표", fontproperties=fontprop, fontsize=title_fontsize, fontweight='bold', pad=20)
+    fig.tight_layout()
     if save_path:
         if not save_path.lower().endswith('.jpg'):
             save_path = os.path.splitext(save_path)[0] + '.jpg'
-        plt.savefig(save_path, bbox_inches='tight', dpi=200, format='jpg')
-    plt.show()
+        fig.savefig(save_path, bbox_inches='tight', dpi=200, format='jpg')
+    if show:
+        plt.show()
+    return save_path
 
 def plot_route(graph, path):
     """경로 시각화